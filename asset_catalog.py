@@ -0,0 +1,231 @@
+"""
+Catálogo persistente de los GIFs de la carpeta assets/.
+
+Guarda por cada GIF su tamaño, fecha de modificación, hash del contenido,
+número de frames, dimensiones y duración total del ciclo en un índice JSON.
+Al arrancar solo se vuelven a abrir los archivos cuyo tamaño o fecha
+cambiaron; el resto se toma del índice.
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+
+CACHE_DIR = Path(".ram_runner_cache")
+DEFAULT_FRAME_DELAY_MS = 100  # Igual que la caché de frames para GIFs sin retardo
+INDEX_VERSION = 1
+
+
+def file_content_hash(path, chunk_size=1024 * 1024):
+    """Hash SHA-1 del contenido de un archivo (lectura por bloques)."""
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_gif_metadata(path):
+    """Retorna (frames, ancho, alto, duración total en ms) de un GIF."""
+    from PIL import Image  # Import diferido: solo se necesita si algo cambió
+
+    with Image.open(path) as img:
+        width, height = img.size
+        frame_count = getattr(img, "n_frames", 1)
+        duration_ms = 0
+        for index in range(frame_count):
+            img.seek(index)
+            delay = img.info.get("duration", 0)
+            duration_ms += delay if delay > 0 else DEFAULT_FRAME_DELAY_MS
+    return frame_count, width, height, duration_ms
+
+
+class AssetInfo:
+    """Metadatos de un GIF del catálogo."""
+
+    __slots__ = ("path", "size", "mtime_ns", "content_hash",
+                 "frame_count", "width", "height", "duration_ms")
+
+    def __init__(self, path, size, mtime_ns, content_hash,
+                 frame_count, width, height, duration_ms):
+        self.path = path
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.content_hash = content_hash
+        self.frame_count = frame_count
+        self.width = width
+        self.height = height
+        self.duration_ms = duration_ms
+
+    @classmethod
+    def from_file(cls, path, stat_result=None):
+        """Lee los metadatos de un archivo (abre y recorre el GIF)."""
+        st = stat_result or os.stat(path)
+        frame_count, width, height, duration_ms = read_gif_metadata(path)
+        return cls(str(path), st.st_size, st.st_mtime_ns, file_content_hash(path),
+                   frame_count, width, height, duration_ms)
+
+    def matches_stat(self, stat_result):
+        """True si el archivo no cambió desde que se catalogó."""
+        return self.size == stat_result.st_size and self.mtime_ns == stat_result.st_mtime_ns
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**{name: data[name] for name in cls.__slots__})
+
+
+class AssetCatalog:
+    """
+    Índice de GIFs con actualización incremental.
+
+    Args:
+        assets_dir: Carpeta con los GIFs
+        index_path: Archivo JSON donde se persiste el índice
+    """
+
+    def __init__(self, assets_dir="assets", index_path=CACHE_DIR / "catalog.json"):
+        self.assets_dir = Path(assets_dir)
+        self.index_path = Path(index_path)
+        self._assets = {}  # ruta (str) -> AssetInfo
+        self._dirty = False
+        self.loaded = False
+
+    def __len__(self):
+        return len(self._assets)
+
+    def __contains__(self, path):
+        return str(path) in self._assets
+
+    def get(self, path):
+        return self._assets.get(str(path))
+
+    def paths(self):
+        """Rutas de los GIFs catalogados, ordenadas."""
+        return sorted(self._assets)
+
+    def load(self):
+        """Carga el índice persistido y lo sincroniza con la carpeta."""
+        try:
+            self.assets_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            print(f"⚠️  No se pudo crear {self.assets_dir}: {e}")
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == INDEX_VERSION:
+                for item in data.get("assets", []):
+                    info = AssetInfo.from_dict(item)
+                    self._assets[info.path] = info
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            # p. ej. la carpeta de caché es un archivo o no hay permisos de lectura
+            print(f"⚠️  No se pudo leer el índice de assets, se reconstruye: {e}")
+        except (ValueError, KeyError, TypeError) as e:
+            print(f"⚠️  Índice de assets inválido, se reconstruye: {e}")
+            self._assets.clear()
+        changes = self.sync()
+        self.save()
+        self.loaded = True
+        return changes
+
+    def sync(self):
+        """
+        Compara la carpeta con el índice.
+
+        Solo se listan los archivos (stat); únicamente los nuevos o
+        modificados se abren para leer sus metadatos.
+
+        Returns:
+            (agregados, modificados, eliminados) como listas de rutas
+        """
+        added, changed = [], []
+        seen = set()
+        try:
+            entries = list(os.scandir(self.assets_dir))
+        except FileNotFoundError:
+            entries = []
+        except OSError as e:
+            print(f"⚠️  No se pudo listar {self.assets_dir}: {e}")
+            entries = []
+
+        for entry in entries:
+            if not entry.name.lower().endswith(".gif") or not entry.is_file():
+                continue
+            path = str(self.assets_dir / entry.name)
+            seen.add(path)
+            st = entry.stat()
+            known = self._assets.get(path)
+            if known is not None and known.matches_stat(st):
+                continue
+            if self._catalog_file(path, st):
+                (changed if known is not None else added).append(path)
+
+        removed = [path for path in self._assets if path not in seen]
+        for path in removed:
+            del self._assets[path]
+        if removed:
+            self._dirty = True
+        return sorted(added), sorted(changed), sorted(removed)
+
+    def update_file(self, path):
+        """
+        Actualiza una sola entrada (p. ej. evento fileChanged).
+
+        Retorna "added", "changed", "removed" o None si no hubo cambios.
+        """
+        path = str(path)
+        known = self._assets.get(path)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            if known is None:
+                return None
+            del self._assets[path]
+            self._dirty = True
+            return "removed"
+        if known is not None and known.matches_stat(st):
+            return None
+        if not self._catalog_file(path, st):
+            return None
+        return "changed" if known is not None else "added"
+
+    def _catalog_file(self, path, st):
+        try:
+            self._assets[path] = AssetInfo.from_file(path, st)
+        except Exception as e:
+            # Archivo a medio copiar o GIF corrupto: se reintenta en el próximo evento
+            print(f"⚠️  No se pudo leer {path}: {e}")
+            if self._assets.pop(path, None) is not None:
+                self._dirty = True
+            return False
+        self._dirty = True
+        return True
+
+    def save(self):
+        """
+        Persiste el índice si hubo cambios (escritura atómica).
+
+        Si no se puede escribir (carpeta de solo lectura, la caché es un
+        archivo, disco lleno...) avisa y sigue con el índice en memoria;
+        se reintenta en el próximo save().
+        """
+        if not self._dirty:
+            return
+        data = {
+            "version": INDEX_VERSION,
+            "assets": [self._assets[path].to_dict() for path in self.paths()],
+        }
+        tmp_path = self.index_path.with_suffix(".tmp")
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=1)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            print(f"⚠️  No se pudo guardar el índice de assets: {e}")
+            return
+        self._dirty = False
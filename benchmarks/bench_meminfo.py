@@ -0,0 +1,50 @@
+"""
+Compara el costo por muestra del porcentaje de RAM: psutil contra el
+lector directo de /proc/meminfo (metric_providers.MeminfoReader).
+
+Solo Linux:
+
+    python benchmarks/bench_meminfo.py [muestras]
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import psutil
+
+from metric_providers import MeminfoReader
+
+
+def measure(fn, samples):
+    """Costo medio por muestra (µs)."""
+    fn()  # Calentamiento
+    start = time.perf_counter()
+    for _ in range(samples):
+        fn()
+    return (time.perf_counter() - start) / samples * 1e6
+
+
+def main():
+    samples = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    try:
+        reader = MeminfoReader()
+    except OSError as e:
+        print(f"⚠️  MeminfoReader no disponible: {e}")
+        return
+
+    psutil_us = measure(lambda: psutil.virtual_memory().percent, samples)
+    reader_us = measure(reader.percent, samples)
+
+    print(f"Muestras: {samples}")
+    print(f"  psutil.virtual_memory(): {psutil_us:8.2f} µs/muestra")
+    print(f"  MeminfoReader.percent(): {reader_us:8.2f} µs/muestra")
+    print(f"  Mejora: x{psutil_us / reader_us:.1f}")
+    print(f"  Valores: psutil={psutil.virtual_memory().percent:.1f}% "
+          f"meminfo={reader.percent():.1f}%")
+    reader.close()
+
+
+if __name__ == "__main__":
+    main()
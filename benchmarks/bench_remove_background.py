@@ -0,0 +1,98 @@
+"""
+Compara quitar_fondo.remove_background con el bucle anterior (un frame a
+la vez, tres comparaciones por canal en uint8 y np.where).
+
+Mide por separado la máscara (solo el cálculo sobre los frames ya
+decodificados, en RGBA y, si el GIF lo permite, sobre índices de paleta) y
+la llamada completa (decodificar, enmascarar y codificar) sobre cada GIF de
+assets/:
+
+    python benchmarks/bench_remove_background.py [repeticiones]
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import numpy as np
+from PIL import Image, ImageSequence
+
+import quitar_fondo
+
+BG_COLOR = (255, 255, 255)
+TOLERANCE = 30
+
+
+def legacy_mask_frame(data, bg_color=BG_COLOR, tolerance=TOLERANCE):
+    """Versión anterior del cálculo por frame (con el desbordamiento en uint8)."""
+    r, g, b, a = data[:, :, 0], data[:, :, 1], data[:, :, 2], data[:, :, 3]
+    mask = (
+        (np.abs(r - bg_color[0]) <= tolerance) &
+        (np.abs(g - bg_color[1]) <= tolerance) &
+        (np.abs(b - bg_color[2]) <= tolerance)
+    )
+    data[:, :, 3] = np.where(mask, 0, 255)
+    return data
+
+
+def legacy_remove_background(input_gif, output_gif):
+    """Versión anterior completa: decodificar, enmascarar y guardar frame a frame."""
+    img = Image.open(input_gif)
+    frames = []
+    durations = []
+    for frame in ImageSequence.Iterator(img):
+        frame = frame.convert('RGBA')
+        data = legacy_mask_frame(np.array(frame))
+        frames.append(Image.fromarray(data, 'RGBA'))
+        durations.append(frame.info.get('duration', 100))
+    frames[0].save(output_gif, save_all=True, append_images=frames[1:], duration=durations,
+                   loop=img.info.get('loop', 0), disposal=2, transparency=0, optimize=False)
+
+
+def best_of(fn, repeats):
+    """Mejor tiempo (ms) de `repeats` ejecuciones."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    gif_paths = sorted((ROOT / "assets").glob("*.gif"))
+    print(f"Tolerancia {TOLERANCE}, mejor de {repeats}")
+    print(f"{'GIF':<16} {'máscara antes':>14} {'RGBA':>9} {'índices':>9} "
+          f"{'total antes':>12} {'ahora':>9}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output = str(Path(tmp) / "out.gif")
+        for path in gif_paths:
+            with Image.open(path) as img:
+                frames, _ = quitar_fondo.decode_frames(img)
+            with quitar_fondo.indexed_loading(), Image.open(path) as img:
+                indexed = quitar_fondo.decode_indexed_frames(img)
+            masker = quitar_fondo.BackgroundMasker(BG_COLOR, TOLERANCE)
+            mask_before = best_of(lambda: [legacy_mask_frame(f) for f in frames], repeats)
+            mask_after = best_of(lambda: masker.apply(frames), repeats)
+            if indexed is not None:
+                indices, palette, transparency, _ = indexed
+                mask_indexed = best_of(
+                    lambda: masker.apply_indexed(indices, palette, transparency), repeats)
+                indexed_text = f"{mask_indexed:6.2f} ms"
+            else:
+                indexed_text = f"{'-':>9}"  # Paletas locales: usa el camino RGBA
+            total_before = best_of(lambda: legacy_remove_background(str(path), output), repeats)
+            total_after = best_of(
+                lambda: quitar_fondo.remove_background(str(path), output, BG_COLOR, TOLERANCE),
+                repeats)
+            print(f"{path.name:<16} {mask_before:11.2f} ms {mask_after:6.2f} ms {indexed_text} "
+                  f"{total_before:9.1f} ms {total_after:6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Mide el costo por tick del efecto arcoíris del texto de RAM.
+
+Compara la implementación anterior (un QLabel al que se le formatea y
+aplica una hoja de estilos en cada tick) con la actual de
+RAMRunnerWidget.update_rgb_color (tabla de colores precalculada y solo la
+banda del texto redibujada en el back buffer). Corre sin pantalla usando la plataforma
+"offscreen" de Qt:
+
+    python benchmarks/bench_rgb_color.py [ticks]
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from PyQt5.QtWidgets import QApplication, QLabel
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QColor
+
+from ram_runner import RAMRunnerWidget
+
+
+def legacy_update_rgb_color(label, hue):
+    """Versión anterior: una hoja de estilos nueva por tick."""
+    color = QColor.fromHsv(hue, 255, 255)
+    rgb_string = f"rgb({color.red()}, {color.green()}, {color.blue()})"
+    label.setStyleSheet(f"""
+        QLabel {{
+            background-color: transparent;
+            color: {rgb_string};
+            padding: 5px;
+        }}
+    """)
+
+
+def measure(app, tick, ticks):
+    """Retorna el costo medio por tick (µs), incluyendo el repintado."""
+    start = time.perf_counter()
+    for i in range(ticks):
+        tick(i)
+        app.processEvents()
+    return (time.perf_counter() - start) / ticks * 1e6
+
+
+def main():
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    app = QApplication(sys.argv)
+    widget = RAMRunnerWidget(None)
+    widget.clock.suspend()
+    widget.show()
+    app.processEvents()
+
+    # El QLabel de antes, en el mismo lugar que la banda de texto actual
+    label = QLabel(widget.ram_text, widget)
+    label.setAlignment(Qt.AlignCenter)
+    label.setFont(widget.text_font)
+    label.setGeometry(widget.text_rect())
+    label.show()
+    before = measure(app, lambda i: legacy_update_rgb_color(label, (i * 2) % 360), ticks)
+    label.hide()
+    label.deleteLater()
+    app.processEvents()
+    after = measure(app, lambda i: widget.update_rgb_color(), ticks)
+
+    print(f"Ticks medidos: {ticks}")
+    print(f"  Antes (setStyleSheet): {before:8.1f} µs/tick")
+    print(f"  Ahora (back buffer):   {after:8.1f} µs/tick")
+    print(f"  Mejora: x{before / after:.1f}")
+
+    widget.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Comprueba que los tres caminos de quitar_fondo.remove_background generan
+el mismo archivo byte a byte: en memoria (save_frames /
+save_indexed_frames), streaming (GifStreamWriter) y en paralelo
+(remove_background_parallel). El camino en paralelo es solo RGBA:
+remove_background nunca lo usa con GIFs indexados, así que en esos no se
+compara.
+
+Además decodifica la salida y la compara con la referencia: cada frame del
+original en RGBA enmascarado con BackgroundMasker.apply. Los píxeles deben
+coincidir en alfa y, donde son opacos, en color; así se detecta si el
+camino indexado (o la paleta exacta) cambia algún píxel.
+
+GifStreamWriter y los procesos usan funciones internas de GifImagePlugin:
+conviene correrlo al actualizar Pillow.
+
+    python benchmarks/check_remove_background.py [GIFs...]
+
+Sin argumentos usa los GIFs de assets/. Sale con código 1 si algún caso
+difiere.
+"""
+import filecmp
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import numpy as np
+from PIL import Image
+
+import quitar_fondo
+
+CASES = [
+    # (color de fondo, tolerancia, métrica)
+    ((255, 255, 255), 30, "canal"),
+    ((255, 255, 255), 60, "euclidiana"),
+    ((0, 255, 0), 0, "canal"),
+]
+
+
+def is_indexed(path):
+    """True si remove_background procesa el GIF como índices de paleta."""
+    with quitar_fondo.indexed_loading(), Image.open(path) as img:
+        return quitar_fondo.decode_indexed_frames(img) is not None
+
+
+def reference_frames(path, bg_color, tolerance, metric):
+    """Frames RGBA del original enmascarados por el motor RGBA, sin repetidos seguidos."""
+    masker = quitar_fondo.BackgroundMasker(bg_color, tolerance, metric)
+    frames = []
+    with Image.open(path) as img:
+        for rgba, _ in quitar_fondo.iter_frames(img):
+            masker.apply(rgba)
+            # Al guardar, un frame idéntico al anterior se une a él
+            if not frames or not np.array_equal(frames[-1], rgba):
+                frames.append(rgba)
+    return frames
+
+
+def pixel_mismatches(output, reference):
+    """Texto con las diferencias entre la salida decodificada y la referencia, o None."""
+    with Image.open(output) as img:
+        frames = [rgba for rgba, _ in quitar_fondo.iter_frames(img)]
+    if len(frames) != len(reference):
+        return f"{len(frames)} frames, se esperaban {len(reference)}"
+    alpha = color = 0
+    for got, expected in zip(frames, reference):
+        opaque = expected[..., 3] == 255
+        alpha += np.count_nonzero((got[..., 3] == 255) != opaque)
+        color += np.count_nonzero(np.any(got[opaque][:, :3] != expected[opaque][:, :3], axis=1))
+    if alpha or color:
+        return f"{alpha} píxeles con otro alfa, {color} opacos con otro color"
+    return None
+
+
+def check_gif(path, out_dir):
+    """Retorna la lista de casos (texto) cuya salida difiere."""
+    failures = []
+    indexed = is_indexed(path)
+    serial = out_dir / "serial.gif"
+    streaming = out_dir / "streaming.gif"
+    parallel = out_dir / "paralelo.gif"
+    for bg_color, tolerance, metric in CASES:
+        args = (bg_color, tolerance)
+        quitar_fondo.remove_background(str(path), str(serial), *args,
+                                       metric=metric, streaming=False)
+        mismatch = pixel_mismatches(serial, reference_frames(path, *args, metric))
+        if mismatch:
+            failures.append(f"referencia RGBA, color={bg_color}, tol={tolerance}, "
+                            f"{metric}: {mismatch}")
+        quitar_fondo.remove_background_streaming(str(path), str(streaming), *args,
+                                                 metric=metric)
+        outputs = [("streaming", streaming)]
+        if not indexed:
+            quitar_fondo.remove_background_parallel(str(path), str(parallel), *args,
+                                                    metric=metric, workers=2)
+            outputs.append(("paralelo", parallel))
+        for name, output in outputs:
+            if not filecmp.cmp(serial, output, shallow=False):
+                failures.append(f"{name}, color={bg_color}, tol={tolerance}, {metric}")
+    return failures
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    paths = [Path(p) for p in argv] or sorted((ROOT / "assets").glob("*.gif"))
+    print(f"Pillow {Image.__version__}, {len(CASES)} casos por GIF")
+
+    failed = 0
+    with tempfile.TemporaryDirectory(prefix="quitar_fondo_check_") as tmp:
+        for path in paths:
+            failures = check_gif(path, Path(tmp))
+            if failures:
+                failed += 1
+                print(f"❌ {path.name}")
+                for failure in failures:
+                    print(f"     difiere: {failure}")
+            else:
+                kind = "índices" if is_indexed(path) else "RGBA"
+                print(f"✓ {path.name} ({kind})")
+
+    if failed:
+        print(f"\n❌ {failed} GIF(s) con salidas distintas")
+        return 1
+    print("\n✓ Salidas idénticas en los tres caminos y a la referencia RGBA")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
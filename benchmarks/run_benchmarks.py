@@ -0,0 +1,303 @@
+"""
+Suite de micro-benchmarks de RAM Runner y de quitar_fondo.py.
+
+Corre sin pantalla (plataforma "offscreen" de Qt), guarda los resultados en
+JSON y los compara con una línea base guardada. Se compara el mínimo de
+las rondas (la mediana se reporta, pero arrastra el ruido de la máquina).
+Un caso cuenta como regresión solo si su mínimo supera al de la línea base
+en más del umbral relativo y, además, en más de su piso de ruido: el mayor
+entre --noise-floor (10 µs por defecto, así un caso de 1 µs nunca falla
+por jitter) y la dispersión mediana - mínimo que tuvo en la línea base:
+
+    python benchmarks/run_benchmarks.py                    # medir y comparar
+    python benchmarks/run_benchmarks.py --save-baseline    # fijar línea base
+    python benchmarks/run_benchmarks.py -k load_gif -k paint
+
+Sale con código 1 si hay alguna regresión. La línea base depende de la
+máquina: conviene regenerarla al cambiar de equipo.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from PyQt5.QtCore import QEventLoop
+from PyQt5.QtWidgets import QApplication
+
+import quitar_fondo
+from frame_cache import FrameCache
+from ram_runner import RAMRunnerWidget
+
+ASSETS_DIR = ROOT / "assets"
+BENCH_DIR = Path(__file__).resolve().parent
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+DEFAULT_OUTPUT = BENCH_DIR / "results.json"
+TOLERANCES = (10, 30, 60)
+
+
+class Benchmark:
+    """
+    Un caso medible.
+
+    Args:
+        name: Identificador estable (clave en el JSON)
+        fn: Función sin argumentos que se mide
+        number: Llamadas por ronda (se promedian)
+        setup: Función opcional que se ejecuta antes de cada llamada (no se mide)
+        prepare: Función opcional que se ejecuta antes de cada ronda (no se mide)
+    """
+
+    def __init__(self, name, fn, number=1000, setup=None, prepare=None):
+        self.name = name
+        self.fn = fn
+        self.number = number
+        self.setup = setup
+        self.prepare = prepare
+
+    def run_round(self):
+        """Retorna el costo medio por llamada (µs) de una ronda."""
+        fn, setup, number = self.fn, self.setup, self.number
+        # Los métodos del widget imprimen mensajes; no deben ensuciar la salida
+        with contextlib.redirect_stdout(io.StringIO()):
+            if self.prepare:
+                self.prepare()
+            if setup:
+                setup()
+            fn()  # Calentamiento
+            elapsed = 0.0
+            for _ in range(number):
+                if setup:
+                    setup()
+                start = time.perf_counter()
+                fn()
+                elapsed += time.perf_counter() - start
+        return elapsed / number * 1e6
+
+
+def run_interleaved(cases, rounds):
+    """
+    Mide `rounds` rondas de cada caso, alternando los casos ronda a ronda.
+
+    Si la máquina se vuelve lenta por un rato, el retraso cae en una ronda
+    de varios casos y no en todas las rondas de uno; el mínimo lo descarta.
+
+    Returns:
+        Lista de tiempos (µs) por ronda de cada caso, en el mismo orden
+    """
+    timings = [[] for _ in cases]
+    for _ in range(rounds):
+        for case, case_timings in zip(cases, timings):
+            case_timings.append(case.run_round())
+    return timings
+
+
+def widget_benchmarks(app, widget, gif_paths):
+    """Casos del widget (los métodos que corren en cada tick o al cambiar de GIF)."""
+    percents = [i * 0.37 % 100 for i in range(1000)]
+    counter = iter(range(10 ** 12))
+
+    def animation_interval():
+        widget.calculate_animation_interval(percents[next(counter) % 1000])
+
+    def rgb_color():
+        widget.update_rgb_color()
+        app.processEvents()
+
+    def ram_display():
+        widget.update_ram_display()
+        app.processEvents()
+
+    cases = [
+        Benchmark("calculate_animation_interval", animation_interval, number=20000),
+        Benchmark("update_rgb_color", rgb_color, number=2000),
+        Benchmark("update_ram_display", ram_display, number=2000),
+    ]
+
+    def load_and_wait(path):
+        # load_gif decodifica en un hilo: se mide hasta que el GIF se aplica
+        widget.load_gif(path)
+        while widget.pending_frames_token is not None:
+            app.processEvents(QEventLoop.WaitForMoreEvents)
+
+    # load_gif sin caché: decodificación y escalado completos de cada asset
+    for path in gif_paths:
+        cases.append(Benchmark(f"load_gif[{path.name}]",
+                               lambda path=path: load_and_wait(path),
+                               number=3, setup=widget.frame_cache.clear))
+
+    def resize_to_large():
+        if gif_paths:
+            load_and_wait(gif_paths[0])
+        widget.current_width, widget.current_height = 480, 439
+        widget.update_size()
+        if widget.gif:
+            # Igual que la fase 2 del redimensionado, pero sin esperar al hilo
+            widget.set_frames(widget.frame_cache.get(widget.gif.path, 480, 439))
+        app.processEvents()
+
+    # Pintado completo del widget ya redimensionado (frames re-escalados)
+    cases.append(Benchmark("paint_resized", widget.repaint, number=200,
+                           prepare=resize_to_large))
+    return cases
+
+
+def remover_benchmarks(gif_paths, out_dir):
+    """Casos de quitar_fondo.remove_background en cada asset y tolerancia."""
+    cases = []
+    for path in gif_paths:
+        output = out_dir / f"{path.stem}_sin_fondo.gif"
+        for tolerance in TOLERANCES:
+            cases.append(Benchmark(
+                f"remove_background[{path.name}, tol={tolerance}]",
+                lambda path=path, output=output, tolerance=tolerance:
+                    quitar_fondo.remove_background(str(path), str(output), tolerance=tolerance),
+                number=1,
+            ))
+    return cases
+
+
+def summarize(name, timings):
+    return {
+        "name": name,
+        "median_us": statistics.median(timings),
+        "min_us": min(timings),
+        "rounds": len(timings),
+    }
+
+
+def noise_floor(base, floor_us):
+    """Aumento absoluto (µs) por debajo del cual un cambio se considera ruido."""
+    return max(floor_us, base["median_us"] - base["min_us"])
+
+
+def compare(results, baseline, threshold, floor_us=10.0):
+    """
+    Compara los mínimos con la línea base.
+
+    Returns:
+        Lista de (nombre, actual, base, cambio relativo, es_regresión)
+    """
+    base_by_name = {case["name"]: case for case in baseline.get("results", [])}
+    rows = []
+    for case in results:
+        base = base_by_name.get(case["name"])
+        if base is None:
+            rows.append((case["name"], case["min_us"], None, None, False))
+            continue
+        change = case["min_us"] / base["min_us"] - 1.0
+        regressed = (change > threshold
+                     and case["min_us"] - base["min_us"] > noise_floor(base, floor_us))
+        rows.append((case["name"], case["min_us"], base["min_us"], change, regressed))
+    return rows
+
+
+def format_us(value):
+    if value is None:
+        return "-"
+    if value >= 1000:
+        return f"{value / 1000:.2f} ms"
+    return f"{value:.1f} µs"
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Micro-benchmarks de RAM Runner.")
+    parser.add_argument("-k", "--filter", action="append", default=[],
+                        help="Solo casos cuyo nombre contenga este texto (repetible)")
+    parser.add_argument("--rounds", type=int, default=15,
+                        help="Rondas por caso; se compara el mínimo (por defecto: 15)")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT,
+                        help="JSON de resultados (por defecto: benchmarks/results.json)")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE,
+                        help="JSON de la línea base (por defecto: benchmarks/baseline.json)")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Aumento relativo que cuenta como regresión (por defecto: 0.25)")
+    parser.add_argument("--noise-floor", type=float, default=10.0,
+                        help="Aumento absoluto mínimo en µs para contar como regresión (por defecto: 10)")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Guarda los resultados como nueva línea base")
+    parser.add_argument("--no-remover", action="store_true",
+                        help="Omite los casos de quitar_fondo (los más lentos)")
+    args = parser.parse_args(argv)
+    if args.rounds < 1:
+        parser.error("--rounds debe ser >= 1")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    gif_paths = sorted(ASSETS_DIR.glob("*.gif"))
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        widget = RAMRunnerWidget(None, FrameCache())
+    # Sin temporizadores ni hilo de muestreo: cada caso controla sus llamadas
+    widget.clock.suspend()
+    widget.sampler.stop()
+    widget.sampler.sample_once()
+    widget.show()
+    app.processEvents()
+
+    with tempfile.TemporaryDirectory(prefix="ram_runner_bench_") as tmp:
+        cases = widget_benchmarks(app, widget, gif_paths)
+        if not args.no_remover:
+            cases += remover_benchmarks(gif_paths, Path(tmp))
+        if args.filter:
+            cases = [c for c in cases if any(f in c.name for f in args.filter)]
+
+        results = []
+        for case, timings in zip(cases, run_interleaved(cases, args.rounds)):
+            result = summarize(case.name, timings)
+            results.append(result)
+            print(f"  {case.name:<48} {format_us(result['min_us']):>12} "
+                  f"(mediana {format_us(result['median_us'])})")
+
+    widget.close()
+
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"✓ Resultados guardados en {args.output}")
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"✓ Línea base actualizada: {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"⚠️  Sin línea base ({args.baseline}); usa --save-baseline para crearla")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    rows = compare(results, baseline, args.threshold, args.noise_floor)
+    regressions = [row for row in rows if row[4]]
+    print(f"\nComparación de mínimos con la línea base (umbral +{args.threshold:.0%}, "
+          f"piso de ruido {format_us(args.noise_floor)}):")
+    for name, current, base, change, regressed in rows:
+        change_text = "nuevo" if change is None else f"{change:+.1%}"
+        mark = "❌" if regressed else "  "
+        print(f"{mark} {name:<48} {format_us(base):>12} -> {format_us(current):>12} ({change_text})")
+
+    if regressions:
+        print(f"\n❌ {len(regressions)} regresión(es) por encima del umbral")
+        return 1
+    print("\n✓ Sin regresiones")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,218 @@
+"""
+Diagnóstico de rendimiento de RAM Runner.
+
+Histogramas de latencia de bajo costo (cubetas fijas en escala logarítmica)
+para los callbacks del reloj, el pintado y el cambio de frame, y un contador
+de frames tardíos o perdidos respecto a los retardos declarados en el GIF.
+Registrar una medición es una búsqueda binaria y dos sumas; no se guarda
+ninguna muestra individual.
+
+Este módulo no depende de Qt.
+"""
+import json
+import os
+import time
+from bisect import bisect_left
+from pathlib import Path
+
+# Límites superiores de las cubetas en ms (la última cubeta es "más que eso")
+BUCKET_BOUNDS_MS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 16, 25, 50, 100, 250, 1000)
+
+
+class LatencyHistogram:
+    """
+    Histograma de latencias con cubetas fijas.
+
+    Los percentiles se estiman con el límite superior de la cubeta donde
+    caen (error acotado por el ancho de la cubeta).
+    """
+
+    __slots__ = ("counts", "count", "total_ms", "max_ms")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, elapsed_ms):
+        self.counts[bisect_left(BUCKET_BOUNDS_MS, elapsed_ms)] += 1
+        self.count += 1
+        self.total_ms += elapsed_ms
+        if elapsed_ms > self.max_ms:
+            self.max_ms = elapsed_ms
+
+    @property
+    def mean_ms(self):
+        return self.total_ms / self.count if self.count else 0.0
+
+    def percentile(self, p):
+        """Percentil `p` (0-100) aproximado, en ms."""
+        if not self.count:
+            return 0.0
+        target = self.count * p / 100.0
+        cumulative = 0
+        for index, n in enumerate(self.counts):
+            cumulative += n
+            if cumulative >= target and n:
+                if index < len(BUCKET_BOUNDS_MS):
+                    return min(BUCKET_BOUNDS_MS[index], self.max_ms)
+                return self.max_ms
+        return self.max_ms
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "mean_ms": round(self.mean_ms, 4),
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "max_ms": round(self.max_ms, 4),
+            "buckets_ms": list(BUCKET_BOUNDS_MS) + ["inf"],
+            "counts": list(self.counts),
+        }
+
+
+class FrameTimingStats:
+    """
+    Compara el momento real de cada cambio de frame con el esperado.
+
+    El esperado sale de los retardos declarados del GIF escalados por la
+    velocidad (no del periodo programado, que respeta el límite de FPS):
+    el tiempo que faltaba para el cambio al mostrar el frame anterior.
+    Solo se registran los cambios de frame reales. Un frame es tardío si
+    llega más de `tolerance` tarde; cada periodo completo que pasa sin
+    mostrar un frame cuenta como un frame perdido. Los frames que el
+    reproductor salta a propósito (límite de FPS) se cuentan aparte.
+
+    Args:
+        min_tolerance_ms: Tolerancia mínima en ms (jitter del temporizador)
+        tolerance_ratio: Tolerancia relativa al periodo esperado
+    """
+
+    def __init__(self, min_tolerance_ms=8.0, tolerance_ratio=0.2):
+        self.min_tolerance_ms = min_tolerance_ms
+        self.tolerance_ratio = tolerance_ratio
+        self.reset()
+
+    def reset(self):
+        self.frames = 0
+        self.late = 0
+        self.dropped = 0
+        self.skipped = 0
+        self.lateness = LatencyHistogram()
+        self.restart()
+
+    def restart(self):
+        """Olvida el último frame (GIF nuevo o reloj reanudado) sin borrar contadores."""
+        self._last_ms = None
+        self._expected_ms = None
+
+    def frame_shown(self, now_ms, next_period_ms, skipped=0):
+        """
+        Registra un cambio de frame.
+
+        Args:
+            now_ms: Momento del cambio (ms, reloj monótono)
+            next_period_ms: Tiempo hasta el siguiente cambio según los
+                retardos declarados (escalados por la velocidad)
+            skipped: Frames intermedios saltados a propósito
+        """
+        self.skipped += skipped
+        if self._last_ms is not None:
+            self.frames += 1
+            expected = self._expected_ms
+            late_ms = now_ms - self._last_ms - expected
+            self.lateness.record(max(0.0, late_ms))
+            if late_ms > max(self.min_tolerance_ms, expected * self.tolerance_ratio):
+                self.late += 1
+                self.dropped += int(late_ms // expected)
+        self._last_ms = now_ms
+        self._expected_ms = next_period_ms
+
+    def to_dict(self):
+        return {
+            "frames": self.frames,
+            "late": self.late,
+            "dropped": self.dropped,
+            "skipped": self.skipped,
+            "lateness": self.lateness.to_dict(),
+        }
+
+
+class Diagnostics:
+    """
+    Registro de histogramas por nombre y estadísticas de frames.
+
+    Uso en un punto caliente:
+
+        start = time.perf_counter()
+        ...
+        diagnostics.record("paintEvent", start)
+    """
+
+    def __init__(self):
+        self.histograms = {}
+        self.frames = FrameTimingStats()
+        self.started = time.time()
+
+    def record(self, name, start):
+        """Registra el tiempo transcurrido desde `start` (time.perf_counter())."""
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = LatencyHistogram()
+        histogram.record(elapsed_ms)
+
+    def timed(self, name, callback):
+        """Envuelve `callback` para medir cada llamada bajo `name`."""
+        record = self.record
+        perf_counter = time.perf_counter
+
+        def wrapper(*args):
+            start = perf_counter()
+            try:
+                return callback(*args)
+            finally:
+                record(name, start)
+
+        wrapper.__name__ = getattr(callback, "__name__", name)
+        return wrapper
+
+    def reset(self):
+        self.histograms.clear()
+        self.frames.reset()
+        self.started = time.time()
+
+    def summary_lines(self):
+        """Líneas de texto cortas (una por histograma) para mostrar en un menú."""
+        lines = []
+        for name in sorted(self.histograms):
+            h = self.histograms[name]
+            lines.append(f"{name}: p50 {h.percentile(50):.2f} ms · p99 {h.percentile(99):.2f} ms"
+                         f" · máx {h.max_ms:.2f} ms (n={h.count})")
+        f = self.frames
+        lines.append(f"Frames: {f.frames} · tardíos {f.late} · perdidos {f.dropped}"
+                     f" · saltados {f.skipped}")
+        return lines
+
+    def to_dict(self, extra=None):
+        data = {
+            "started": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started)),
+            "exported": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "histograms": {name: h.to_dict() for name, h in sorted(self.histograms.items())},
+            "frames": self.frames.to_dict(),
+        }
+        if extra:
+            data.update(extra)
+        return data
+
+    def export(self, path, extra=None):
+        """Escribe el diagnóstico como JSON (escritura atómica). Retorna la ruta."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(extra), f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        return path
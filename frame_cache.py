@@ -0,0 +1,249 @@
+"""
+Caché de frames decodificados y pre-escalados para los GIFs de RAM Runner.
+
+Cada GIF se decodifica una sola vez por tamaño y sus frames se guardan como
+QPixmap ya escalados al tamaño del widget. La reproducción en estado estable
+solo intercambia pixmaps: no hay decodificación LZW ni escalado por frame.
+"""
+import itertools
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt5.QtCore import QObject, Qt, pyqtSignal
+from PyQt5.QtGui import QImageReader, QPixmap
+
+DEFAULT_FRAME_DELAY_MS = 100  # GIFs sin retardo declarado
+
+
+class DecodedGif:
+    """Frames de un GIF ya escalados, con el retardo (ms) de cada uno."""
+
+    __slots__ = ("path", "width", "height", "frames", "delays", "nbytes")
+
+    def __init__(self, path, width, height, frames, delays):
+        self.path = path
+        self.width = width
+        self.height = height
+        self.frames = frames
+        self.delays = delays
+        # QPixmap de 32 bits por píxel
+        self.nbytes = width * height * 4 * len(frames)
+
+    def __len__(self):
+        return len(self.frames)
+
+
+def read_gif_images(gif_path, cancelled=None):
+    """
+    Decodifica todos los frames de un GIF.
+
+    Retorna (lista de QImage, lista de retardos en ms). QImage puede usarse
+    fuera del hilo de la interfaz, así que esta función también sirve para
+    hilos de trabajo. Si `cancelled()` se vuelve verdadero entre dos frames
+    la decodificación se abandona y se retorna ([], []).
+    """
+    reader = QImageReader(str(gif_path))
+    images = []
+    delays = []
+    while reader.canRead():
+        if cancelled is not None and cancelled():
+            return [], []
+        image = reader.read()
+        if image.isNull():
+            break
+        delay = reader.nextImageDelay()
+        images.append(image)
+        delays.append(delay if delay > 0 else DEFAULT_FRAME_DELAY_MS)
+    return images, delays
+
+
+class FrameCache:
+    """
+    Caché LRU de GIFs decodificados con límite de memoria.
+
+    Las entradas se indexan por (ruta, ancho, alto). Cuando el total supera
+    `budget_bytes` se descartan las entradas usadas hace más tiempo (la que
+    se acaba de pedir nunca se descarta).
+
+    Args:
+        budget_bytes: Memoria máxima aproximada para todos los frames
+    """
+
+    def __init__(self, budget_bytes=64 * 1024 * 1024):
+        self.budget_bytes = budget_bytes
+        self._entries = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, gif_path, width, height):
+        """
+        Retorna el DecodedGif para ese tamaño, decodificándolo si hace falta.
+
+        Retorna None si el archivo no se puede leer.
+        """
+        key = (str(gif_path), width, height)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        images, delays = read_gif_images(gif_path)
+        if not images:
+            return None
+        return self.put_images(gif_path, width, height, images, delays)
+
+    def put_images(self, gif_path, width, height, images, delays, scaled=False):
+        """Convierte QImages (escalándolas si hace falta) y las guarda en caché."""
+        if not scaled:
+            images = scale_images(images, width, height)
+        frames = [QPixmap.fromImage(image) for image in images]
+        entry = DecodedGif(str(gif_path), width, height, frames, delays)
+        self._store((entry.path, width, height), entry)
+        return entry
+
+    def _store(self, key, entry):
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.total_bytes -= old.nbytes
+        self._entries[key] = entry
+        self.total_bytes += entry.nbytes
+        self._evict()
+
+    def _evict(self):
+        while self.total_bytes > self.budget_bytes and len(self._entries) > 1:
+            _, old = self._entries.popitem(last=False)
+            self.total_bytes -= old.nbytes
+
+    def fits(self, gif_path, width, height, frame_count=None):
+        """
+        True si el GIF cabría en la caché sin desalojar otros (para precargar).
+
+        No decodifica nada: la precarga se pide a un AsyncFrameLoader.
+        `frame_count` (p. ej. del catálogo de assets) evita abrir el archivo
+        para estimar su tamaño.
+        """
+        if frame_count is None:
+            frame_count = QImageReader(str(gif_path)).imageCount()
+        return self.total_bytes + width * height * 4 * max(1, frame_count) <= self.budget_bytes
+
+    def discard(self, gif_path):
+        """Elimina todos los tamaños de un GIF (el archivo cambió o se borró)."""
+        gif_path = str(gif_path)
+        for key in [key for key in self._entries if key[0] == gif_path]:
+            self.total_bytes -= self._entries.pop(key).nbytes
+
+    def clear(self):
+        self._entries.clear()
+        self.total_bytes = 0
+
+    def stats(self):
+        """Resumen para depuración."""
+        return {
+            "entries": len(self._entries),
+            "total_bytes": self.total_bytes,
+            "budget_bytes": self.budget_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def scale_images(images, width, height):
+    """Escalado de alta calidad de una lista de QImage (seguro en hilos)."""
+    return [
+        image.scaled(width, height, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+        for image in images
+    ]
+
+
+class AsyncFrameLoader(QObject):
+    """
+    Decodifica y escala GIFs en un hilo de trabajo.
+
+    El trabajo pesado (decodificar y escalar QImages) ocurre fuera del hilo
+    de la interfaz; la conversión a QPixmap y el guardado en la caché se hacen
+    al recibir el resultado en el hilo de la interfaz. Cada petición retorna
+    un token y `ready(token, DecodedGif | None)` se emite al terminar. Una
+    petición cancelada (cancel) no emite nada.
+
+    Con `evict=False` (precarga) el resultado solo se guarda si todavía cabe
+    sin desalojar otras entradas; si no, `ready` llega con None.
+    """
+
+    ready = pyqtSignal(int, object)
+    _images_ready = pyqtSignal(int, object)
+
+    def __init__(self, frame_cache, parent=None, max_workers=1):
+        super().__init__(parent)
+        self.frame_cache = frame_cache
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix="FrameLoader")
+        self._tokens = itertools.count(1)
+        self._futures = {}  # token -> Future (peticiones sin terminar)
+        self._cancelled = set()
+        self._no_evict = set()  # Tokens de precarga
+        self._images_ready.connect(self._on_images_ready)
+
+    def request(self, gif_path, width, height, evict=True):
+        """Encola la decodificación+escalado. Retorna el token de la petición."""
+        token = next(self._tokens)
+        self._futures[token] = self._executor.submit(self._work, token, str(gif_path), width, height)
+        if not evict:
+            self._no_evict.add(token)
+        return token
+
+    def cancel(self, token):
+        """
+        Cancela una petición: si no empezó se descarta; si ya se está
+        decodificando se abandona en el siguiente frame.
+        """
+        future = self._futures.pop(token, None)
+        if future is not None and not future.cancel():
+            self._cancelled.add(token)
+        else:
+            self._no_evict.discard(token)
+
+    def _work(self, token, gif_path, width, height):
+        def cancelled():
+            return token in self._cancelled
+
+        try:
+            images, delays = read_gif_images(gif_path, cancelled)
+            if cancelled():
+                images = []
+            images = scale_images(images, width, height)
+            payload = (gif_path, width, height, images, delays)
+        except Exception as e:
+            print(f"⚠️  Error al decodificar {gif_path}: {e}")
+            payload = (gif_path, width, height, [], [])
+        try:
+            self._images_ready.emit(token, payload)
+        except RuntimeError:
+            pass  # El loader ya fue destruido (app cerrándose)
+
+    def _on_images_ready(self, token, payload):
+        self._futures.pop(token, None)
+        no_evict = token in self._no_evict
+        self._no_evict.discard(token)
+        if token in self._cancelled:
+            self._cancelled.discard(token)
+            return
+        gif_path, width, height, images, delays = payload
+        gif = None
+        if no_evict and not self.frame_cache.fits(gif_path, width, height, len(images)):
+            images = []  # El presupuesto se llenó mientras tanto
+        if images:
+            gif = self.frame_cache.put_images(gif_path, width, height, images, delays, scaled=True)
+        self.ready.emit(token, gif)
+
+    def shutdown(self):
+        """Descarta las peticiones pendientes sin esperar a la actual."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
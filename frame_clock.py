@@ -0,0 +1,156 @@
+"""
+Reloj de frames unificado para RAM Runner.
+
+En lugar de varios QTimer independientes (cada uno despertando el proceso en
+momentos distintos) hay un único temporizador que se programa para el próximo
+vencimiento y ejecuta en la misma activación todos los subsistemas que vencen
+dentro de una pequeña ventana de tolerancia.
+"""
+import time
+from collections import deque
+
+from PyQt5.QtCore import QObject, QTimer, Qt
+
+
+class _ClockEntry:
+    __slots__ = ("period_ms", "callback", "due", "coalesce")
+
+    def __init__(self, period_ms, callback, due, coalesce=True):
+        self.period_ms = period_ms
+        self.callback = callback
+        self.due = due
+        self.coalesce = coalesce
+
+
+class FrameClock(QObject):
+    """
+    Planificador de un solo temporizador para todos los subsistemas.
+
+    Cada subsistema se registra con un nombre, un periodo y un callback. Los
+    periodos se alinean a una época común, así 50 ms, 100 ms y 1000 ms
+    coinciden en la misma activación.
+
+    Args:
+        parent: QObject padre
+        coalesce_ms: Un subsistema que vence dentro de esta ventana se
+            ejecuta junto con la activación actual en vez de provocar otra
+    """
+
+    def __init__(self, parent=None, coalesce_ms=10):
+        super().__init__(parent)
+        self.coalesce_ms = coalesce_ms
+        self._entries = {}
+        self._suspended = False
+        self._epoch = self._now()
+        self._wakeups = deque()  # Marcas de tiempo de activaciones (último segundo)
+        self.total_wakeups = 0
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._tick)
+
+    @staticmethod
+    def _now():
+        return time.monotonic() * 1000.0
+
+    def _aligned_due(self, period_ms, now):
+        """Próximo múltiplo de `period_ms` desde la época del reloj."""
+        elapsed = now - self._epoch
+        return self._epoch + (int(elapsed // period_ms) + 1) * period_ms
+
+    # --- Registro de subsistemas ---
+    def register(self, name, period_ms, callback, coalesce=True):
+        """
+        Registra (o reemplaza) un subsistema que se ejecuta cada `period_ms`.
+
+        Con coalesce=False el subsistema nunca se adelanta para unirse a otra
+        activación ni se alinea a la época: corre recién cuando vence (p. ej.
+        "frames", que se reprograma en cada llamada y no sirve de nada antes
+        de tiempo).
+        """
+        if period_ms <= 0:
+            raise ValueError("period_ms debe ser > 0")
+        now = self._now()
+        due = self._aligned_due(period_ms, now) if coalesce else now + period_ms
+        self._entries[name] = _ClockEntry(period_ms, callback, due, coalesce)
+        self._schedule(now)
+
+    def unregister(self, name):
+        """Elimina un subsistema. No hace nada si no estaba registrado."""
+        if self._entries.pop(name, None) is not None:
+            self._schedule()
+
+    def set_period(self, name, period_ms):
+        """Cambia el periodo de un subsistema; el próximo vencimiento cuenta desde ahora."""
+        entry = self._entries.get(name)
+        if entry is None or period_ms <= 0:
+            return
+        now = self._now()
+        entry.period_ms = period_ms
+        entry.due = now + period_ms
+        self._schedule(now)
+
+    # --- Suspensión ---
+    def suspend(self):
+        """Detiene todas las activaciones (p. ej. widget oculto)."""
+        self._suspended = True
+        self._timer.stop()
+        self._wakeups.clear()
+
+    def resume(self):
+        """Reanuda el reloj; los subsistemas vencen de nuevo desde ahora."""
+        if not self._suspended:
+            return
+        self._suspended = False
+        now = self._now()
+        for entry in self._entries.values():
+            if entry.coalesce:
+                entry.due = self._aligned_due(entry.period_ms, now)
+            else:
+                entry.due = now + entry.period_ms
+        self._schedule(now)
+
+    def is_suspended(self):
+        return self._suspended
+
+    # --- Estadísticas ---
+    def wakeups_per_second(self):
+        """Activaciones del temporizador durante el último segundo."""
+        self._trim_wakeups(self._now())
+        return len(self._wakeups)
+
+    def _trim_wakeups(self, now):
+        while self._wakeups and now - self._wakeups[0] > 1000.0:
+            self._wakeups.popleft()
+
+    # --- Núcleo ---
+    def _schedule(self, now=None):
+        if self._suspended or not self._entries:
+            self._timer.stop()
+            return
+        if now is None:
+            now = self._now()
+        next_due = min(entry.due for entry in self._entries.values())
+        self._timer.start(max(0, int(round(next_due - now))))
+
+    def _tick(self):
+        now = self._now()
+        self.total_wakeups += 1
+        self._wakeups.append(now)
+        self._trim_wakeups(now)
+
+        limit = now + self.coalesce_ms
+        for name, entry in list(self._entries.items()):
+            # Un callback anterior pudo desregistrar este subsistema
+            if self._entries.get(name) is not entry:
+                continue
+            if entry.due > (limit if entry.coalesce else now):
+                continue
+            entry.due += entry.period_ms
+            if entry.due <= now:
+                # Se perdieron vencimientos (sistema cargado): no recuperarlos en ráfaga
+                entry.due = now + entry.period_ms
+            entry.callback()
+
+        self._schedule()
@@ -0,0 +1,65 @@
+"""
+Reproducción de GIFs por tiempo para RAM Runner.
+
+Un cursor de tiempo virtual avanza según el tiempo real transcurrido
+multiplicado por la velocidad; el frame que toca es el que contiene esa
+posición dentro del ciclo. Así, a velocidades altas los frames intermedios
+se saltan en lugar de mostrarse todos, y el widget nunca pinta más rápido
+que su límite de FPS.
+
+Este módulo no depende de Qt.
+"""
+from bisect import bisect_right
+from itertools import accumulate
+
+DEFAULT_MAX_FPS = 60
+
+
+class PlaybackCursor:
+    """
+    Posición de reproducción dentro del ciclo de un GIF.
+
+    Args:
+        delays: Retardo declarado de cada frame (ms, todos > 0)
+    """
+
+    def __init__(self, delays):
+        if not delays:
+            raise ValueError("Se necesita al menos un frame")
+        self.delays = list(delays)
+        # Fin de cada frame dentro del ciclo: [d0, d0 + d1, ...]
+        self._ends = list(accumulate(self.delays))
+        self.cycle_ms = self._ends[-1]
+        self.position_ms = 0.0  # Posición virtual dentro del ciclo
+        self.index = 0
+
+    def __len__(self):
+        return len(self.delays)
+
+    def index_at(self, position_ms):
+        """Frame que se muestra en una posición del ciclo."""
+        return min(bisect_right(self._ends, position_ms), len(self.delays) - 1)
+
+    def advance(self, elapsed_ms, speed):
+        """
+        Avanza el cursor `elapsed_ms` de tiempo real a velocidad `speed`
+        (1.0 = velocidad original).
+
+        Returns:
+            Cuántos frames se avanzaron (0 si sigue el mismo; más de 1 si
+            se saltaron frames intermedios)
+        """
+        if elapsed_ms <= 0 or speed <= 0:
+            return 0
+        frames = len(self.delays)
+        position = self.position_ms + elapsed_ms * speed
+        cycles = int(position // self.cycle_ms)
+        self.position_ms = position - cycles * self.cycle_ms
+        previous = self.index
+        self.index = self.index_at(self.position_ms)
+        return cycles * frames + self.index - previous
+
+    def time_to_next_ms(self, speed):
+        """Tiempo real (ms) hasta el próximo cambio de frame a velocidad `speed`."""
+        remaining = self._ends[self.index] - self.position_ms
+        return remaining / speed if speed > 0 else float("inf")
@@ -0,0 +1,91 @@
+"""
+Historial de tamaño fijo de una métrica, respaldado por NumPy.
+
+Guarda horas de muestras en un arreglo preasignado y mantiene mínimo,
+máximo y media de forma incremental: agregar una muestra es O(1) amortizado
+y consultar las estadísticas no recorre el historial.
+"""
+from collections import deque
+
+import numpy as np
+
+
+class MetricHistory:
+    """
+    Buffer circular de muestras con estadísticas incrementales.
+
+    El mínimo y el máximo de la ventana se mantienen con colas monótonas;
+    la media con una suma acumulada.
+
+    Args:
+        capacity: Número máximo de muestras (p. ej. 4 h a 1 muestra/s = 14400)
+    """
+
+    def __init__(self, capacity=4 * 3600):
+        if capacity < 1:
+            raise ValueError("capacity debe ser >= 1")
+        self.capacity = capacity
+        self._values = np.zeros(capacity, dtype=np.float64)
+        self._count = 0  # Total de muestras agregadas (no se reinicia)
+        self._sum = 0.0
+        self._min_queue = deque()  # (índice, valor), valores crecientes
+        self._max_queue = deque()  # (índice, valor), valores decrecientes
+
+    def __len__(self):
+        return min(self._count, self.capacity)
+
+    def append(self, value):
+        """Agrega una muestra, descartando la más antigua si está lleno."""
+        index = self._count
+        slot = index % self.capacity
+        if index >= self.capacity:
+            self._sum -= self._values[slot]
+        self._values[slot] = value
+        self._sum += value
+        self._count += 1
+
+        oldest = self._count - self.capacity  # Índice más antiguo aún en la ventana
+        min_queue, max_queue = self._min_queue, self._max_queue
+        while min_queue and min_queue[-1][1] >= value:
+            min_queue.pop()
+        min_queue.append((index, value))
+        while min_queue[0][0] < oldest:
+            min_queue.popleft()
+        while max_queue and max_queue[-1][1] <= value:
+            max_queue.pop()
+        max_queue.append((index, value))
+        while max_queue[0][0] < oldest:
+            max_queue.popleft()
+
+    def clear(self):
+        self._count = 0
+        self._sum = 0.0
+        self._min_queue.clear()
+        self._max_queue.clear()
+
+    @property
+    def minimum(self):
+        return self._min_queue[0][1] if self._min_queue else None
+
+    @property
+    def maximum(self):
+        return self._max_queue[0][1] if self._max_queue else None
+
+    @property
+    def mean(self):
+        n = len(self)
+        return self._sum / n if n else None
+
+    @property
+    def latest(self):
+        return self._values[(self._count - 1) % self.capacity] if self._count else None
+
+    def tail(self, n):
+        """Las últimas `n` muestras en orden cronológico (copia)."""
+        n = min(n, len(self))
+        if n == 0:
+            return np.empty(0, dtype=np.float64)
+        end = self._count % self.capacity
+        if end >= n:
+            return self._values[end - n:end].copy()
+        return np.concatenate((self._values[self.capacity - (n - end):], self._values[:end]))
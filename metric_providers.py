@@ -0,0 +1,359 @@
+"""
+Proveedores de métricas para RAM Runner.
+
+Cada proveedor entrega un porcentaje (0-100) que puede mostrar el widget y
+controlar la velocidad de la animación. MetricSampler lee todos los
+proveedores activos en una sola pasada (read_batch).
+
+Este módulo no depende de Qt. psutil se importa al usarlo por primera vez:
+en Linux la RAM se lee de /proc/meminfo y el modo headless arranca sin
+cargarlo.
+"""
+import os
+import sys
+from contextlib import ExitStack
+from pathlib import Path
+
+
+class MetricProvider:
+    """
+    Interfaz base de un proveedor.
+
+    Atributos de clase:
+        key: Identificador estable (se usa en el sampler y el menú)
+        label: Prefijo corto del texto del widget ("RAM: 42.0%")
+        title: Nombre largo para el menú
+    """
+
+    key = ""
+    label = ""
+    title = ""
+
+    def available(self):
+        """True si el proveedor funciona en este sistema."""
+        return True
+
+    def read(self):
+        """Retorna el valor actual en porcentaje (0-100)."""
+        raise NotImplementedError
+
+    def process(self):
+        """psutil.Process que lee este proveedor (para oneshot), o None."""
+        return None
+
+
+class MeminfoReader:
+    """
+    Lector rápido de MemTotal/MemAvailable en /proc/meminfo (solo Linux).
+
+    Mantiene el descriptor abierto y relee el archivo con preadv sobre un
+    buffer preasignado, sin crear objetos bytes por lectura. Las posiciones
+    de las dos líneas se calculan una vez; si el kernel cambia el formato
+    (p. ej. una cifra gana un dígito) se vuelven a buscar.
+
+    Lanza OSError si /proc/meminfo no existe o no se puede leer.
+    """
+
+    TOTAL_LABEL = b"MemTotal:"
+    AVAILABLE_LABEL = b"MemAvailable:"
+
+    def __init__(self, path="/proc/meminfo", buffer_size=8192):
+        if not hasattr(os, "preadv"):
+            raise OSError("os.preadv no disponible en esta plataforma")
+        self._fd = os.open(path, os.O_RDONLY)
+        self._buffer = bytearray(buffer_size)
+        self._buffers = [self._buffer]  # Lista reutilizada para preadv
+        self._total_at = -1
+        self._available_at = -1
+        try:
+            self._locate(self._fill())
+        except Exception:
+            os.close(self._fd)
+            raise
+
+    def _fill(self):
+        return os.preadv(self._fd, self._buffers, 0)
+
+    def _locate(self, length):
+        """Busca el inicio de las etiquetas MemTotal y MemAvailable."""
+        self._total_at = self._buffer.find(self.TOTAL_LABEL, 0, length)
+        self._available_at = self._buffer.find(self.AVAILABLE_LABEL, 0, length)
+        if self._total_at < 0 or self._available_at < 0:
+            raise OSError("/proc/meminfo sin MemTotal/MemAvailable")
+
+    def _parse_kb(self, index, length):
+        """Entero en kB que sigue a la etiqueta (salta los espacios)."""
+        buf = self._buffer
+        while index < length and buf[index] == 32:  # ' '
+            index += 1
+        value = 0
+        while index < length:
+            digit = buf[index] - 48
+            if digit < 0 or digit > 9:
+                break
+            value = value * 10 + digit
+            index += 1
+        return value
+
+    def read(self):
+        """Retorna (MemTotal, MemAvailable) en kB."""
+        length = self._fill()
+        buf = self._buffer
+        if not (buf.startswith(self.TOTAL_LABEL, self._total_at)
+                and buf.startswith(self.AVAILABLE_LABEL, self._available_at)):
+            self._locate(length)
+        total = self._parse_kb(self._total_at + len(self.TOTAL_LABEL), length)
+        available = self._parse_kb(self._available_at + len(self.AVAILABLE_LABEL), length)
+        return total, available
+
+    def percent(self):
+        """Porcentaje de RAM usada, con la misma fórmula que psutil."""
+        total, available = self.read()
+        return (total - available) * 100.0 / total
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def __del__(self):
+        try:
+            self.close()
+        except (AttributeError, OSError):
+            pass
+
+
+class HostRamProvider(MetricProvider):
+    """
+    Uso de RAM del sistema.
+
+    En Linux usa MeminfoReader (lectura directa de /proc/meminfo); en el
+    resto de sistemas, o si falla, psutil.virtual_memory.
+    """
+
+    key = "ram"
+    label = "RAM"
+    title = "RAM del sistema"
+
+    def __init__(self, use_fast_path=True):
+        self._reader = None
+        if use_fast_path and sys.platform.startswith("linux"):
+            try:
+                self._reader = MeminfoReader()
+            except OSError:
+                self._reader = None
+
+    @property
+    def backend(self):
+        return "meminfo" if self._reader is not None else "psutil"
+
+    def read(self):
+        if self._reader is not None:
+            try:
+                return self._reader.percent()
+            except (OSError, ZeroDivisionError):
+                self._reader.close()
+                self._reader = None
+        import psutil
+        return psutil.virtual_memory().percent
+
+
+class SwapProvider(MetricProvider):
+    """Uso de la memoria swap."""
+
+    key = "swap"
+    label = "Swap"
+    title = "Swap"
+
+    def available(self):
+        import psutil
+        try:
+            return psutil.swap_memory().total > 0
+        except (OSError, RuntimeError):
+            return False
+
+    def read(self):
+        import psutil
+        return psutil.swap_memory().percent
+
+
+class CpuProvider(MetricProvider):
+    """Uso de CPU desde la lectura anterior (no bloquea)."""
+
+    key = "cpu"
+    label = "CPU"
+    title = "CPU"
+
+    def __init__(self):
+        import psutil
+        self._cpu_percent = psutil.cpu_percent
+        # La primera llamada sin intervalo solo fija la referencia
+        self._cpu_percent(interval=None)
+
+    def read(self):
+        return self._cpu_percent(interval=None)
+
+
+class ProcessRssProvider(MetricProvider):
+    """
+    Memoria residente (RSS) de un proceso, como porcentaje de la RAM total.
+
+    Args:
+        pid: Proceso a vigilar (por defecto, el propio RAM Runner)
+    """
+
+    key = "proceso"
+    label = "Proc"
+    title = "RSS de un proceso"
+
+    def __init__(self, pid=None):
+        import psutil
+        self.pid = pid or os.getpid()
+        self._process = psutil.Process(self.pid)
+        self._total = psutil.virtual_memory().total
+
+    def available(self):
+        return self._process.is_running()
+
+    def process(self):
+        return self._process
+
+    def read(self):
+        return self._process.memory_info().rss * 100.0 / self._total
+
+
+def find_cgroup2_dir():
+    """
+    Carpeta cgroup v2 del proceso actual, o None si no hay cgroup v2.
+
+    Usa /proc/self/cgroup (línea "0::<ruta>") y el punto de montaje cgroup2
+    de /proc/self/mountinfo; funciona tanto con jerarquía unificada
+    (/sys/fs/cgroup) como híbrida (/sys/fs/cgroup/unified).
+    """
+    try:
+        with open("/proc/self/cgroup", "r") as f:
+            relative = next((line.strip()[3:] for line in f if line.startswith("0::")), None)
+        if relative is None:
+            return None
+        mount_point = None
+        with open("/proc/self/mountinfo", "r") as f:
+            for line in f:
+                fields = line.split()
+                separator = fields.index("-")
+                if fields[separator + 1] == "cgroup2":
+                    mount_point = fields[4]
+                    break
+    except (OSError, ValueError, IndexError):
+        return None
+    if mount_point is None:
+        return None
+    return Path(mount_point) / relative.lstrip("/")
+
+
+class CgroupMemoryProvider(MetricProvider):
+    """
+    Memoria del cgroup v2 (contenedor): memory.current / memory.max.
+
+    Si el cgroup no tiene límite ("max") se usa la RAM total del sistema
+    como denominador.
+
+    Args:
+        cgroup_dir: Carpeta del cgroup (por defecto la del proceso actual)
+    """
+
+    key = "cgroup"
+    label = "Cgroup"
+    title = "Memoria del contenedor (cgroup v2)"
+
+    def __init__(self, cgroup_dir=None):
+        self.cgroup_dir = Path(cgroup_dir) if cgroup_dir else find_cgroup2_dir()
+        self._host_total = None  # Solo se necesita si el cgroup no tiene límite
+
+    def available(self):
+        return (self.cgroup_dir is not None
+                and (self.cgroup_dir / "memory.current").is_file()
+                and (self.cgroup_dir / "memory.max").is_file())
+
+    def read(self):
+        with open(self.cgroup_dir / "memory.current", "rb") as f:
+            current = int(f.read())
+        with open(self.cgroup_dir / "memory.max", "rb") as f:
+            raw = f.read().strip()
+        if raw == b"max":
+            if self._host_total is None:
+                import psutil
+                self._host_total = psutil.virtual_memory().total
+            limit = self._host_total
+        else:
+            limit = int(raw)
+        return current * 100.0 / limit
+
+
+# Orden en que aparecen en el menú
+PROVIDER_CLASSES = (
+    HostRamProvider,
+    CgroupMemoryProvider,
+    SwapProvider,
+    CpuProvider,
+    ProcessRssProvider,
+)
+DEFAULT_PROVIDER = HostRamProvider.key
+
+
+def available_providers():
+    """Instancias de los proveedores que funcionan en este sistema (clave -> proveedor)."""
+    providers = {}
+    for cls in PROVIDER_CLASSES:
+        try:
+            provider = cls()
+            if provider.available():
+                providers[provider.key] = provider
+        except Exception:
+            continue
+    return providers
+
+
+def create_provider(key):
+    """
+    Crea solo el proveedor pedido (sin instanciar los demás).
+
+    Lanza ValueError si la clave no existe o no funciona en este sistema.
+    """
+    for cls in PROVIDER_CLASSES:
+        if cls.key == key:
+            provider = cls()
+            if not provider.available():
+                raise ValueError(f"La métrica '{key}' no está disponible en este sistema")
+            return provider
+    raise ValueError(f"Métrica desconocida: '{key}'")
+
+
+def read_batch(providers):
+    """
+    Lee varios proveedores en una sola pasada.
+
+    Los proveedores de procesos se leen dentro de psutil.Process.oneshot(),
+    así psutil recolecta la información de cada proceso una sola vez.
+
+    Returns:
+        Lista de (clave, valor); los proveedores que fallan se omiten
+    """
+    errors = (OSError, ValueError)
+    psutil = sys.modules.get("psutil")
+    if psutil is not None:
+        errors += (psutil.Error,)
+
+    results = []
+    with ExitStack() as stack:
+        seen = set()
+        for provider in providers:
+            process = provider.process()
+            if process is not None and process.pid not in seen:
+                seen.add(process.pid)
+                stack.enter_context(process.oneshot())
+        for provider in providers:
+            try:
+                results.append((provider.key, provider.read()))
+            except errors:
+                continue
+    return results
@@ -1,237 +1,1117 @@
-from PIL import Image, ImageSequence
+"""
+Elimina el fondo sólido de GIFs animados (los hace transparentes).
+
+    python quitar_fondo.py                           # interfaz gráfica (Tkinter)
+    python quitar_fondo.py assets/ [-o carpeta]      # lote por línea de comandos
+    python quitar_fondo.py "assets/*.gif" --color verde --tolerance 40 -j 4
+
+En modo lote, cada salida se registra en una caché (hash del GIF de
+entrada + color, tolerancia y métrica); al repetir el comando se saltan
+los archivos que no cambiaron.
+"""
+from PIL import Image, ImageSequence, GifImagePlugin
 import numpy as np
-import tkinter as tk
-from tkinter import filedialog, messagebox, ttk
+import argparse
+import glob
+import json
 import os
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from pathlib import Path
+
+from asset_catalog import CACHE_DIR, file_content_hash
+
+# Métricas de distancia de color
+#   "canal":      |r - R| <= tol, |g - G| <= tol y |b - B| <= tol (cubo)
+#   "euclidiana": sqrt((r - R)² + (g - G)² + (b - B)²) <= tol (esfera)
+METRICS = ("canal", "euclidiana")
+
+# Por encima de este tamaño decodificado (N × H × W × 4 bytes),
+# remove_background procesa de a un frame para no agotar la RAM
+STREAMING_THRESHOLD_BYTES = 256 * 1024 * 1024
+
+# Por debajo de este tamaño decodificado, remove_background no reparte entre
+# procesos aunque se pidan: arrancar el pool (spawn en Windows, ~0.2-0.4 s)
+# cuesta más que procesar la animación completa en serie (~90 MB/s)
+PARALLEL_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+# GifStreamWriter y los procesos de remove_background_parallel usan funciones
+# internas de GifImagePlugin (probado con Pillow 12.3.0). Si otra versión las
+# renombra o cambia su firma, remove_background vuelve al camino en memoria
+PILLOW_INTERNAL_ERRORS = (AttributeError, TypeError)
+
+# Paleta cuantizada de un frame en memoria compartida: hasta 256 entradas RGBA
+PALETTE_BYTES = 1024
+PALETTE_MODES = ("RGB", "RGBA")
 
-def remove_background(input_gif, output_gif, bg_color=(255, 255, 255), tolerance=30, progress_callback=None):
+
+def iter_frames(img, progress_callback=None):
     """
-    Elimina el fondo de un GIF animado y lo hace transparente.
-    
-    Args:
-        input_gif: Ruta del GIF de entrada
-        output_gif: Ruta del GIF de salida
-        bg_color: Color del fondo a eliminar (R, G, B)
-        tolerance: Tolerancia para la detección del color (0-255)
-        progress_callback: Función para actualizar el progreso
+    Genera los frames de un GIF uno a uno como (arreglo RGBA (H, W, 4) uint8,
+    duración en ms). Cada arreglo es nuevo y se puede modificar.
+    """
+    total_frames = getattr(img, 'n_frames', 1)
+    for idx, frame in enumerate(ImageSequence.Iterator(img)):
+        if progress_callback:
+            progress_callback(idx + 1, total_frames)
+        yield np.array(frame.convert('RGBA')), frame.info.get('duration', 100)
+
+
+def decode_frames(img, progress_callback=None, masker=None):
     """
-    img = Image.open(input_gif)
+    Decodifica todas las imágenes de un GIF en un solo arreglo (N, H, W, 4).
     
-    frames = []
+    Con `masker` (BackgroundMasker), cada frame se enmascara apenas se
+    decodifica, mientras todavía está en caché.
+    
+    Returns:
+        (frames uint8 RGBA, lista de duraciones en ms)
+    """
+    total_frames = getattr(img, 'n_frames', 1)
+    width, height = img.size
+    frames = np.empty((total_frames, height, width, 4), dtype=np.uint8)
     durations = []
     
+    for idx, (rgba, duration) in enumerate(iter_frames(img, progress_callback)):
+        if masker is not None:
+            masker.apply(rgba)
+        frames[idx] = rgba
+        durations.append(duration)
+    return frames, durations
+
+
+# LOADING_STRATEGY es global en Pillow: se cambia solo bajo este candado
+_loading_lock = threading.Lock()
+
+
+@contextmanager
+def indexed_loading():
+    """
+    Mientras dure, Pillow entrega los frames de un GIF en modo P (índices
+    de paleta) en lugar de convertirlos a RGB después del primero. Un frame
+    con paleta local sigue llegando en RGB/RGBA.
+    
+    Requiere Pillow >= 9.1; con versiones anteriores no cambia nada.
+    """
+    strategy = getattr(GifImagePlugin, 'LoadingStrategy', None)
+    if strategy is None:
+        yield
+        return
+    with _loading_lock:
+        previous = GifImagePlugin.LOADING_STRATEGY
+        GifImagePlugin.LOADING_STRATEGY = strategy.RGB_AFTER_DIFFERENT_PALETTE_ONLY
+        try:
+            yield
+        finally:
+            GifImagePlugin.LOADING_STRATEGY = previous
+
+
+class UnsupportedIndexedFrame(Exception):
+    """Un frame no se puede procesar como índices (paleta local, RGB/RGBA)."""
+
+
+_UNKNOWN = object()
+
+
+def iter_indexed_frames(img, progress_callback=None):
+    """
+    Genera los frames de un GIF abierto dentro de indexed_loading() como
+    (índices uint8 (H, W), paleta uint8 (256, 3), índice transparente del
+    original o None, duración en ms). Los índices se pueden modificar.
+    
+    Todos los frames deben llegar en modo P con la misma paleta y el mismo
+    índice transparente en su propio bloque GCE; si no, lanza
+    UnsupportedIndexedFrame en cuanto lo detecta y hay que usar iter_frames.
+    """
     total_frames = getattr(img, 'n_frames', 1)
+    first = None
+    palette = None
     
     for idx, frame in enumerate(ImageSequence.Iterator(img)):
+        if frame.mode != 'P':
+            raise UnsupportedIndexedFrame(f"Frame {idx} en modo {frame.mode}")
+        # En modo P, info['transparency'] conserva el del primer frame en toda
+        # la animación; el de cada frame solo está en _frame_transparency
+        transparency = getattr(frame, '_frame_transparency', _UNKNOWN)
+        if transparency is _UNKNOWN:
+            raise UnsupportedIndexedFrame(f"Frame {idx}: índice transparente desconocido")
+        key = (frame.getpalette(), transparency)
+        if first is None:
+            first = key
+            palette = np.zeros((256, 3), dtype=np.uint8)
+            if key[0]:
+                entries = np.asarray(key[0][:768], dtype=np.uint8).reshape(-1, 3)
+                palette[:len(entries)] = entries
+        elif key != first:
+            raise UnsupportedIndexedFrame(f"Frame {idx} con otra paleta o transparencia")
         if progress_callback:
             progress_callback(idx + 1, total_frames)
+        yield np.array(frame), palette, first[1], frame.info.get('duration', 100)
+
+
+def decode_indexed_frames(img, progress_callback=None):
+    """
+    Decodifica un GIF abierto dentro de indexed_loading() como índices de paleta.
+    
+    Returns:
+        (índices uint8 (N, H, W), paleta uint8 (256, 3), índice transparente
+        del original o None, lista de duraciones en ms), o None si algún
+        frame no es compatible (ver iter_indexed_frames)
+    """
+    total_frames = getattr(img, 'n_frames', 1)
+    width, height = img.size
+    indices = np.empty((total_frames, height, width), dtype=np.uint8)
+    durations = []
+    palette = transparency = None
+    
+    try:
+        for idx, (frame, palette, transparency, duration) in enumerate(
+                iter_indexed_frames(img, progress_callback)):
+            indices[idx] = frame
+            durations.append(duration)
+    except UnsupportedIndexedFrame:
+        return None
+    return indices, palette, transparency, durations
+
+
+class BackgroundMasker:
+    """
+    Calcula qué píxeles son fondo, sin desbordamientos y sin arreglos temporales.
+    
+    Métrica "canal": cada canal se compara contra el rango [lo, hi] =
+    [R - tol, R + tol] recortado a 0-255 con una sola resta sin signo:
+    (c - lo) mod 256 <= hi - lo. El "desbordamiento" de uint8 es justamente
+    lo que descarta los valores menores que lo.
+    
+    Métrica "euclidiana": las diferencias se calculan en int32 (la suma de
+    cuadrados llega a 3 * 255²).
+    
+    apply() trabaja de a un frame: sobre la animación completa cada pasada
+    recorre toda la memoria y el costo lo pone el ancho de banda; por frame,
+    los buffers caben en caché. Con la métrica "canal" resta y compara los
+    cuatro canales en una sola pasada contigua (filas de H × W·4 bytes) y
+    combina los cuatro resultados de cada píxel leyéndolos como un uint32.
+    
+    Los buffers se reservan una vez por forma y se reutilizan entre llamadas.
+    
+    Args:
+        bg_color: Color del fondo (R, G, B)
+        tolerance: Tolerancia (0-255 por canal, o radio de la esfera)
+        metric: "canal" o "euclidiana" (ver METRICS)
+    """
+    
+    def __init__(self, bg_color=(255, 255, 255), tolerance=30, metric="canal"):
+        if metric not in METRICS:
+            raise ValueError(f"Métrica desconocida: {metric!r} (usa {', '.join(METRICS)})")
+        self.bg_color = tuple(int(c) for c in bg_color)
+        self.tolerance = tolerance
+        self.metric = metric
+        tolerance = max(0, int(tolerance))
+        self.low = [max(0, c - tolerance) for c in self.bg_color]
+        self.span = [min(255, c + tolerance) - low for c, low in zip(self.bg_color, self.low)]
+        self.limit = tolerance * tolerance
+        # Rango por píxel RGBA; en alfa, [0, 0] marca lo que ya era transparente
+        self._pixel_low = np.array(self.low + [0], dtype=np.uint8)
+        self._pixel_span = np.array(self.span + [0], dtype=np.uint8)
+        self._shape = None
+        self._frame_shape = None
+    
+    def _buffers(self, shape):
+        if shape != self._shape:
+            self._shape = shape
+            self._mask = np.empty(shape, dtype=bool)
+            self._match = np.empty(shape, dtype=bool)
+            self._bytes = np.empty(shape, dtype=np.uint8)
+            if self.metric == "euclidiana":
+                self._distance = np.empty(shape, dtype=np.int32)
+                self._diff = np.empty(shape, dtype=np.int32)
+    
+    def mask(self, rgba):
+        """
+        Máscara booleana del fondo para un arreglo (..., 4) o (..., 3) uint8.
         
-        frame = frame.convert('RGBA')
-        data = np.array(frame)
+        El resultado es un buffer interno: se sobrescribe en la siguiente llamada.
+        """
+        self._buffers(rgba.shape[:-1])
+        mask = self._mask
+        if self.metric == "canal":
+            diff, match = self._bytes, self._match
+            for channel in range(3):
+                np.subtract(rgba[..., channel], np.uint8(self.low[channel]), out=diff)
+                np.less_equal(diff, self.span[channel], out=match if channel else mask)
+                if channel:
+                    np.logical_and(mask, match, out=mask)
+        else:
+            distance, diff = self._distance, self._diff
+            for channel in range(3):
+                target = diff if channel else distance
+                np.subtract(rgba[..., channel], self.bg_color[channel], out=target, dtype=np.int32)
+                np.multiply(target, target, out=target)
+                if channel:
+                    np.add(distance, diff, out=distance)
+            np.less_equal(distance, self.limit, out=mask)
+        return mask
+    
+    def _frame_buffers(self, shape):
+        if shape != self._frame_shape:
+            self._frame_shape = shape
+            height, width = shape[:2]
+            self._row_low = np.tile(self._pixel_low, width)
+            self._row_span = np.tile(self._pixel_span, width)
+            self._lane_bytes = np.empty((height, width * 4), dtype=np.uint8)
+            self._lanes = np.empty((height, width * 4), dtype=bool)
+            self._keep = np.empty((height, width), dtype=bool)
+    
+    def _apply_lanes(self, frame):
+        """apply() de la métrica "canal" para un frame (H, W, 4) contiguo."""
+        self._frame_buffers(frame.shape)
+        rows = frame.reshape(frame.shape[0], -1)
+        np.subtract(rows, self._row_low, out=self._lane_bytes)
+        np.less_equal(self._lane_bytes, self._row_span, out=self._lanes)
+        # Cada píxel queda como 4 bytes 0/1 (R, G, B, alfa == 0); leídos como
+        # uint32 little-endian valen >= 0x010101 solo si R, G y B están en
+        # rango (0x010101) o si alfa ya era 0 (>= 0x01000000)
+        pixels = self._lanes.view('<u4').reshape(self._keep.shape)
+        np.less(pixels, 0x010101, out=self._keep)
+        np.multiply(self._keep.view(np.uint8), np.uint8(255), out=frame[..., 3])
+    
+    def apply(self, rgba):
+        """
+        Pone alfa 0 en el fondo y 255 en el resto (en el mismo arreglo),
+        para un frame (H, W, 4) o una animación (N, H, W, 4).
         
-        r, g, b, a = data[:,:,0], data[:,:,1], data[:,:,2], data[:,:,3]
+        Los píxeles que ya eran transparentes en el original siguen
+        transparentes: su RGB no es un color real (suele ser un resto de
+        un frame anterior).
+        """
+        if rgba.ndim > 3:
+            for frame in rgba.reshape((-1,) + rgba.shape[-3:]):
+                self.apply(frame)
+            return rgba
+        if self.metric == "canal" and rgba.flags.c_contiguous:
+            self._apply_lanes(rgba)
+            return rgba
+        mask = self.mask(rgba)
+        np.equal(rgba[..., 3], 0, out=self._match)
+        np.logical_or(mask, self._match, out=mask)
+        # alfa = 255 - 255 * máscara, sin pasar por np.where
+        np.multiply(mask.view(np.uint8), np.uint8(255), out=self._bytes)
+        np.subtract(np.uint8(255), self._bytes, out=rgba[..., 3])
+        return rgba
+    
+    def apply_indexed(self, indices, palette, transparency=None):
+        """
+        Versión para frames indexados (modo P), en el mismo arreglo de índices.
         
-        mask = (
-            (np.abs(r - bg_color[0]) <= tolerance) &
-            (np.abs(g - bg_color[1]) <= tolerance) &
-            (np.abs(b - bg_color[2]) <= tolerance)
-        )
+        La prueba de tolerancia corre una vez por entrada de la paleta (256
+        colores) y arma una tabla booleana; todos los índices de fondo se
+        remapean a un único índice transparente con una búsqueda en tabla.
+        Si el fondo ocupa una sola entrada de la paleta no hace falta remapear.
         
-        data[:,:,3] = np.where(mask, 0, 255)
+        Args:
+            indices: Índices uint8 (N, H, W) o (H, W)
+            palette: Paleta uint8 (256, 3)
+            transparency: Índice transparente del original (sigue transparente)
         
-        new_frame = Image.fromarray(data, 'RGBA')
-        frames.append(new_frame)
-        durations.append(frame.info.get('duration', 100))
+        Returns:
+            Índice transparente de la salida, o None si ningún color es fondo
+        """
+        lookup = self.mask(palette).copy()
+        if transparency is not None:
+            lookup[transparency] = True
+        background = np.flatnonzero(lookup)
+        if not len(background):
+            return None
+        transparent = int(background[0])
+        if len(background) > 1:
+            remap = np.arange(256, dtype=np.uint8)
+            remap[lookup] = transparent
+            # mode='clip' no usa buffer intermedio: cada índice se lee antes de escribirse
+            np.take(remap, indices, out=indices, mode='clip')
+        return transparent
+
+
+# Multiplicadores impares para el hash de colores; si uno choca se prueba el siguiente
+HASH_MULTIPLIERS = (0x9E3779B1, 0x85EBCA77, 0xC2B2AE3D, 0x27D4EB2F,
+                    0x165667B1, 0xFD7046C5, 0xB55A4F09, 0x61C88647)
+
+
+class FramePalettizer:
+    """
+    Pasa frames RGBA ya enmascarados (alfa 0 o 255) a modo P sin cuantizar.
+    
+    Tras quitar el fondo un frame suele tener pocas decenas de colores
+    opacos: se cuentan con getcolors(), todo lo transparente se une en el
+    índice 0 y cada píxel se traduce a su índice con un hash multiplicativo
+    sobre una tabla de 65536 entradas. Es bastante más barato que la
+    cuantización de Pillow al guardar y no pierde colores. Con más de 255
+    colores opacos (o sin hash libre de choques) devuelve la imagen RGBA y
+    Pillow cuantiza como siempre.
+    """
     
-    frames[0].save(
+    def __init__(self):
+        self._shape = None
+        self._lookup = np.zeros(65536, dtype=np.uint8)
+    
+    def _buffers(self, shape):
+        if shape != self._shape:
+            self._shape = shape
+            self._keys = np.empty(shape, dtype=np.uint32)
+            self._slots = np.empty(shape, dtype=np.uint32)
+    
+    def _hash(self, colors):
+        for multiplier in HASH_MULTIPLIERS:
+            slots = (colors * np.uint32(multiplier)) >> np.uint32(16)
+            if len(np.unique(slots)) == len(colors):
+                return multiplier, slots
+        return None, None
+    
+    def image(self, rgba):
+        """Imagen lista para GIF (P con el índice 0 transparente, o RGBA)."""
+        if not rgba.flags.c_contiguous:
+            return Image.fromarray(rgba, 'RGBA')
+        self._buffers(rgba.shape[:2])
+        keys = self._keys
+        pixels = rgba.view('<u4').reshape(keys.shape)
+        # Los transparentes valen 0 sin importar su RGB (alfa está en el byte alto)
+        np.multiply(pixels, pixels >= 0xFF000000, out=keys)
+        colors = Image.fromarray(keys.view(np.uint8).reshape(rgba.shape), 'RGBA').getcolors(256)
+        if colors is None:
+            return Image.fromarray(rgba, 'RGBA')
+        packed = {r | g << 8 | b << 16 | a << 24 for _, (r, g, b, a) in colors}
+        packed.add(0)
+        colors = np.array(sorted(packed), dtype=np.uint32)
+        if len(colors) > 256:
+            return Image.fromarray(rgba, 'RGBA')
+        multiplier, slots = self._hash(colors)
+        if multiplier is None:
+            return Image.fromarray(rgba, 'RGBA')
+        self._lookup[slots] = np.arange(len(colors), dtype=np.uint8)
+        np.multiply(keys, np.uint32(multiplier), out=self._slots)
+        np.right_shift(self._slots, np.uint32(16), out=self._slots)
+        # Índices nuevos por frame: fromarray puede compartir la memoria
+        image = Image.fromarray(np.take(self._lookup, self._slots))
+        image.putpalette(colors.view(np.uint8).reshape(-1, 4)[:, :3].tobytes())
+        return image
+
+
+def save_frames(frames, durations, output_gif, loop=0):
+    """Codifica frames RGBA (arreglo o lista) como GIF animado."""
+    palettizer = FramePalettizer()
+    images = [palettizer.image(frame) for frame in frames]
+    images[0].save(
         output_gif,
         save_all=True,
-        append_images=frames[1:],
+        append_images=images[1:],
         duration=durations,
-        loop=img.info.get('loop', 0),
+        loop=loop,
         disposal=2,
         transparency=0,
         optimize=False
     )
 
-class GifBackgroundRemoverApp:
-    def __init__(self, root):
-        self.root = root
-        self.root.title("Eliminar Fondo de GIF")
-        self.root.geometry("550x450")
-        self.root.resizable(False, False)
-        
-        self.input_file = ""
-        self.output_file = ""
-        
-        self.create_widgets()
+
+def indexed_image(indices, palette_bytes):
+    """Imagen P a partir de índices uint8 (H, W) y la paleta en bytes."""
+    image = Image.fromarray(indices)
+    image.putpalette(palette_bytes)  # L -> P
+    return image
+
+
+def save_indexed_frames(indices, palette, durations, output_gif, loop=0, transparency=None):
+    """Codifica frames indexados con una paleta común (sin cuantizar) como GIF animado."""
+    palette_bytes = palette.tobytes()
+    images = [indexed_image(frame, palette_bytes) for frame in indices]
+    options = {'transparency': transparency} if transparency is not None else {}
+    images[0].save(
+        output_gif,
+        save_all=True,
+        append_images=images[1:],
+        duration=durations,
+        loop=loop,
+        disposal=2,
+        optimize=False,
+        **options
+    )
+
+
+class GifStreamWriter:
+    """
+    Codifica un GIF animado frame a frame, con memoria acotada.
     
-    def create_widgets(self):
-        # Frame principal
-        main_frame = ttk.Frame(self.root, padding="20")
-        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        
-        # Título
-        title = ttk.Label(main_frame, text="🎬 Eliminar Fondo de GIF", font=("Arial", 16, "bold"))
-        title.grid(row=0, column=0, columnspan=3, pady=(0, 20))
-        
-        # Seleccionar archivo de entrada
-        ttk.Label(main_frame, text="Archivo GIF:", font=("Arial", 10)).grid(row=1, column=0, sticky=tk.W, pady=5)
-        self.input_label = ttk.Label(main_frame, text="No seleccionado", foreground="gray")
-        self.input_label.grid(row=2, column=0, columnspan=2, sticky=tk.W, pady=(0, 10))
-        
-        btn_input = ttk.Button(main_frame, text="Seleccionar GIF", command=self.select_input)
-        btn_input.grid(row=2, column=2, pady=(0, 10))
-        
-        # Color de fondo
-        ttk.Label(main_frame, text="Color de fondo a eliminar:", font=("Arial", 10)).grid(row=3, column=0, sticky=tk.W, pady=5)
-        
-        color_frame = ttk.Frame(main_frame)
-        color_frame.grid(row=4, column=0, columnspan=3, sticky=tk.W, pady=(0, 15))
-        
-        self.color_var = tk.StringVar(value="white")
-        ttk.Radiobutton(color_frame, text="Blanco", variable=self.color_var, value="white").pack(side=tk.LEFT, padx=5)
-        ttk.Radiobutton(color_frame, text="Verde", variable=self.color_var, value="green").pack(side=tk.LEFT, padx=5)
-        ttk.Radiobutton(color_frame, text="Negro", variable=self.color_var, value="black").pack(side=tk.LEFT, padx=5)
-        ttk.Radiobutton(color_frame, text="Personalizado", variable=self.color_var, value="custom").pack(side=tk.LEFT, padx=5)
-        
-        # Color personalizado
-        custom_frame = ttk.Frame(main_frame)
-        custom_frame.grid(row=5, column=0, columnspan=3, sticky=tk.W, pady=(0, 15))
-        
-        ttk.Label(custom_frame, text="RGB personalizado:").pack(side=tk.LEFT)
-        self.r_var = tk.StringVar(value="255")
-        self.g_var = tk.StringVar(value="255")
-        self.b_var = tk.StringVar(value="255")
-        
-        ttk.Label(custom_frame, text="R:").pack(side=tk.LEFT, padx=(10, 0))
-        ttk.Entry(custom_frame, textvariable=self.r_var, width=5).pack(side=tk.LEFT, padx=2)
-        ttk.Label(custom_frame, text="G:").pack(side=tk.LEFT, padx=(5, 0))
-        ttk.Entry(custom_frame, textvariable=self.g_var, width=5).pack(side=tk.LEFT, padx=2)
-        ttk.Label(custom_frame, text="B:").pack(side=tk.LEFT, padx=(5, 0))
-        ttk.Entry(custom_frame, textvariable=self.b_var, width=5).pack(side=tk.LEFT, padx=2)
-        
-        # Tolerancia
-        ttk.Label(main_frame, text="Tolerancia (0-100):", font=("Arial", 10)).grid(row=6, column=0, sticky=tk.W, pady=5)
-        
-        tolerance_frame = ttk.Frame(main_frame)
-        tolerance_frame.grid(row=7, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 15))
-        
-        self.tolerance_var = tk.IntVar(value=30)
-        self.tolerance_scale = ttk.Scale(tolerance_frame, from_=0, to=100, variable=self.tolerance_var, orient=tk.HORIZONTAL)
-        self.tolerance_scale.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
-        
-        self.tolerance_label = ttk.Label(tolerance_frame, text="30")
-        self.tolerance_label.pack(side=tk.LEFT)
-        
-        self.tolerance_var.trace('w', self.update_tolerance_label)
-        
-        # Barra de progreso
-        self.progress = ttk.Progressbar(main_frame, length=400, mode='determinate')
-        self.progress.grid(row=8, column=0, columnspan=3, pady=15, sticky=(tk.W, tk.E))
-        
-        self.progress_label = ttk.Label(main_frame, text="", foreground="blue")
-        self.progress_label.grid(row=9, column=0, columnspan=3)
+    Image.save(save_all=True) de Pillow retiene todos los frames hasta el
+    final. Este escritor sigue el mismo algoritmo paso a paso (con las
+    funciones de GifImagePlugin), así que el archivo es idéntico byte a byte
+    al de save_frames / save_indexed_frames, pero solo guarda el frame
+    pendiente (si el siguiente es idéntico se le suma su duración), el
+    anterior para calcular la diferencia y el primero mientras no se sepa
+    si la animación tiene más de un frame distinto. Como esas funciones son
+    internas, remove_background vuelve al camino en memoria si fallan (ver
+    PILLOW_INTERNAL_ERRORS y benchmarks/check_remove_background.py).
+    
+    Uso:
+        with GifStreamWriter(ruta, loop=0, transparency=0) as writer:
+            for image, duration in frames:
+                writer.add(image, duration)
+    
+    Si el bloque termina con una excepción, el archivo a medio escribir se borra.
+    
+    Args:
+        output_gif: Ruta del GIF de salida
+        loop: Repeticiones (0 = infinito)
+        disposal: Método de disposición de cada frame
+        transparency: Índice transparente, o None
+    """
+    
+    def __init__(self, output_gif, loop=0, disposal=2, transparency=None):
+        self.output_gif = output_gif
+        # Equivale a im.encoderinfo en Image.save(..., optimize=False)
+        self._info = {'loop': loop, 'disposal': disposal, 'optimize': False}
+        if transparency is not None:
+            self._info['transparency'] = transparency
+        self._fp = open(output_gif, 'wb')
+        self._first = None        # Primera imagen original (caso de un solo frame)
+        self._color = None        # Índice transparente para el fondo de la disposición 2
+        self._first_frame = None  # Primer frame normalizado (paleta del fondo)
+        self._background = None
+        self._previous = None
+        self._pending = None      # (frame, bbox, encoderinfo) aún sin escribir
+        self._written = 0
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
+    
+    def add(self, image, duration=None):
+        """Agrega un frame (cualquier modo que acepte Pillow para GIF)."""
+        info = self._info
+        frame = GifImagePlugin._normalize_mode(image.copy())
+        if self._pending is None:
+            self._first = image
+            self._color = info.get('transparency', image.info.get('transparency'))
+            for key, value in frame.info.items():
+                if key != 'transparency' and isinstance(key, str):
+                    info.setdefault(key, value)
         
-        # Botón procesar
-        self.btn_process = ttk.Button(main_frame, text="🚀 Procesar GIF", command=self.process_gif, state=tk.DISABLED)
-        self.btn_process.grid(row=10, column=0, columnspan=3, pady=20)
-    
-    def update_tolerance_label(self, *args):
-        self.tolerance_label.config(text=str(self.tolerance_var.get()))
-    
-    def select_input(self):
-        filename = filedialog.askopenfilename(
-            title="Seleccionar GIF",
-            filetypes=[("GIF files", "*.gif"), ("All files", "*.*")]
-        )
-        if filename:
-            self.input_file = filename
-            self.input_label.config(text=os.path.basename(filename), foreground="black")
-            
-            # Sugerir nombre de salida
-            base = os.path.splitext(filename)[0]
-            self.output_file = f"{base}_sin_fondo.gif"
-            
-            self.btn_process.config(state=tk.NORMAL)
-    
-    def get_bg_color(self):
-        color_choice = self.color_var.get()
+        encoderinfo = info.copy()
+        if 'transparency' in frame.info:
+            encoderinfo.setdefault('transparency', frame.info['transparency'])
+        frame = GifImagePlugin._normalize_palette(frame, None, encoderinfo)
+        if duration is not None:
+            encoderinfo['duration'] = duration
         
-        if color_choice == "white":
-            return (255, 255, 255)
-        elif color_choice == "green":
-            return (0, 255, 0)
-        elif color_choice == "black":
-            return (0, 0, 0)
-        else:  # custom
-            try:
-                r = int(self.r_var.get())
-                g = int(self.g_var.get())
-                b = int(self.b_var.get())
-                
-                if not (0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255):
-                    raise ValueError
-                
-                return (r, g, b)
-            except:
-                messagebox.showerror("Error", "Los valores RGB deben ser números entre 0 y 255")
-                return None
-    
-    def update_progress(self, current, total):
-        progress_percent = (current / total) * 100
-        self.progress['value'] = progress_percent
-        self.progress_label.config(text=f"Procesando frame {current} de {total}...")
-        self.root.update_idletasks()
-    
-    def process_gif(self):
-        if not self.input_file:
-            messagebox.showerror("Error", "Por favor selecciona un archivo GIF")
+        bbox = None
+        if self._pending is not None:
+            _, bbox = GifImagePlugin._getbbox(self._previous, frame)
+            if not bbox:
+                # Idéntico al anterior: se alarga la duración del pendiente
+                if encoderinfo.get('duration'):
+                    self._pending[2]['duration'] += encoderinfo['duration']
+                return
+            if self._pending[2].get('disposal') == 2:
+                color = self._color
+                if color is not None:
+                    if self._background is None:
+                        background = GifImagePlugin._get_background(frame, color)
+                        self._background = Image.new('P', frame.size, background)
+                        first_palette = self._first_frame.palette
+                        self._background.putpalette(first_palette, first_palette.mode)
+                    bbox = GifImagePlugin._getbbox(self._background, frame)[1]
+                else:
+                    bbox = (0, 0) + frame.size
+            self._write(self._pending)
+        else:
+            self._first_frame = frame
+        self._previous = frame
+        self._pending = (frame, bbox, encoderinfo)
+    
+    def _write(self, pending):
+        frame, bbox, encoderinfo = pending
+        if not bbox:
+            for block in GifImagePlugin._get_global_header(frame, encoderinfo):
+                self._fp.write(block)
+            offset = (0, 0)
+        else:
+            encoderinfo['include_color_table'] = True
+            if bbox != (0, 0) + frame.size:
+                frame = frame.crop(bbox)
+            offset = bbox[:2]
+        GifImagePlugin._write_frame_data(self._fp, frame, offset, encoderinfo)
+        self._written += 1
+        # Ya hay dos frames distintos: no hará falta la imagen original
+        self._first = None
+    
+    def close(self):
+        """Escribe el último frame y cierra el archivo."""
+        if self._pending is None:
+            self.abort()
+            raise ValueError("El GIF no tiene frames")
+        try:
+            if self._written:
+                self._write(self._pending)
+            else:
+                # Un solo frame distinto: Pillow lo guarda como imagen simple
+                first = self._first
+                first.encoderinfo = self._info
+                first.encoderconfig = ()
+                if 'duration' in self._pending[2]:
+                    first.encoderinfo['duration'] = self._pending[2]['duration']
+                GifImagePlugin._write_single_frame(first, self._fp, None)
+            self._fp.write(b';')
+        except Exception:
+            self.abort()
+            raise
+        self._fp.close()
+        self._pending = self._previous = self._first_frame = self._background = None
+    
+    def abort(self):
+        """Cierra y borra el archivo a medio escribir."""
+        self._fp.close()
+        try:
+            os.remove(self.output_gif)
+        except OSError:
+            pass
+
+
+def _stream_indexed(img, output_gif, masker, loop, progress_callback):
+    """Camino indexado de remove_background_streaming (lanza UnsupportedIndexedFrame)."""
+    writer = None
+    palette_bytes = None
+    try:
+        for indices, palette, transparency, duration in iter_indexed_frames(img, progress_callback):
+            transparent = masker.apply_indexed(indices, palette, transparency)
+            if writer is None:
+                palette_bytes = palette.tobytes()
+                writer = GifStreamWriter(output_gif, loop=loop, transparency=transparent)
+            writer.add(indexed_image(indices, palette_bytes), duration)
+    except BaseException:
+        if writer is not None:
+            writer.abort()
+        raise
+    writer.close()
+
+
+def remove_background_streaming(input_gif, output_gif, bg_color=(255, 255, 255), tolerance=30,
+                                progress_callback=None, metric="canal"):
+    """
+    Igual que remove_background, pero decodifica, enmascara y codifica de a
+    un frame (generadores + GifStreamWriter).
+    
+    La memoria pico no depende de la cantidad de frames y el archivo de
+    salida es idéntico byte a byte. Con paletas locales, el intento indexado
+    se descarta en el primer frame incompatible y se repite en RGBA.
+    """
+    masker = BackgroundMasker(bg_color, tolerance, metric)
+    with indexed_loading(), Image.open(input_gif) as img:
+        try:
+            _stream_indexed(img, output_gif, masker, img.info.get('loop', 0), progress_callback)
             return
-        
-        bg_color = self.get_bg_color()
-        if bg_color is None:
+        except UnsupportedIndexedFrame:
+            pass
+    
+    palettizer = FramePalettizer()
+    with Image.open(input_gif) as img:
+        with GifStreamWriter(output_gif, loop=img.info.get('loop', 0), transparency=0) as writer:
+            for rgba, duration in iter_frames(img, progress_callback):
+                writer.add(palettizer.image(masker.apply(rgba)), duration)
+
+
+def _shared_views(blocks, shape):
+    """
+    Arreglos sobre los bloques de memoria compartida de remove_background_parallel:
+    frames RGBA de entrada, índices cuantizados, paletas y (largo de la
+    paleta, modo, índice transparente o -1) de cada frame.
+    """
+    total, height, width = shape
+    return (
+        np.ndarray((total, height, width, 4), dtype=np.uint8, buffer=blocks[0].buf),
+        np.ndarray((total, height, width), dtype=np.uint8, buffer=blocks[1].buf),
+        np.ndarray((total, PALETTE_BYTES), dtype=np.uint8, buffer=blocks[2].buf),
+        np.ndarray((total, 3), dtype=np.int32, buffer=blocks[3].buf),
+    )
+
+
+def _process_shared_frames(names, shape, start, stop, bg_color, tolerance, metric):
+    """
+    Tarea de un proceso: enmascara los frames [start, stop) y los pasa a
+    paleta igual que save_frames (FramePalettizer y, si hace falta,
+    GifImagePlugin._normalize_mode),
+    leyendo y escribiendo en la memoria compartida.
+    
+    Returns:
+        Cantidad de frames procesados
+    """
+    blocks = [shared_memory.SharedMemory(name=name) for name in names]
+    try:
+        frames, indices, palettes, meta = _shared_views(blocks, shape)
+        masker = BackgroundMasker(bg_color, tolerance, metric)
+        palettizer = FramePalettizer()
+        for idx in range(start, stop):
+            rgba = palettizer.image(masker.apply(frames[idx]))
+            frame = GifImagePlugin._normalize_mode(rgba)
+            raw = frame.palette.palette
+            indices[idx] = np.asarray(frame)
+            palettes[idx, :len(raw)] = np.frombuffer(raw, dtype=np.uint8)
+            meta[idx] = (len(raw), PALETTE_MODES.index(frame.palette.mode),
+                         frame.info.get('transparency', -1))
+        return stop - start
+    finally:
+        # Las vistas deben soltarse antes de cerrar los bloques
+        frames = indices = palettes = meta = rgba = None
+        for block in blocks:
+            block.close()
+
+
+def _remove_background_shared(img, blocks, shape, output_gif, masker_args, workers,
+                              progress_callback):
+    """Decodifica en los bloques, reparte los frames entre procesos y codifica en orden."""
+    total = shape[0]
+    frames, indices, palettes, meta = _shared_views(blocks, shape)
+    names = [block.name for block in blocks]
+    # Varios trozos por proceso: el progreso avanza y la carga se reparte mejor
+    chunk = max(1, total // (workers * 4))
+    durations = []
+    pending = deque()
+    done = 0
+    
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        start = 0
+        # La decodificación es secuencial; cada trozo se envía apenas está listo
+        for idx, (rgba, duration) in enumerate(iter_frames(img)):
+            frames[idx] = rgba
+            durations.append(duration)
+            if idx + 1 - start == chunk or idx + 1 == total:
+                pending.append(pool.submit(_process_shared_frames, names, shape,
+                                           start, idx + 1, *masker_args))
+                start = idx + 1
+            while pending and pending[0].done():
+                done += pending.popleft().result()
+                if progress_callback:
+                    progress_callback(done, total)
+        while pending:
+            done += pending.popleft().result()
+            if progress_callback:
+                progress_callback(done, total)
+    
+    # Reensamblado en orden: los frames ya vienen cuantizados
+    with GifStreamWriter(output_gif, loop=img.info.get('loop', 0), transparency=0) as writer:
+        for idx in range(total):
+            length, mode, transparency = (int(value) for value in meta[idx])
+            image = Image.fromarray(indices[idx])
+            image.putpalette(palettes[idx, :length].tobytes(), PALETTE_MODES[mode])
+            if transparency >= 0:
+                image.info['transparency'] = transparency
+            writer.add(image, durations[idx])
+
+
+def remove_background_parallel(input_gif, output_gif, bg_color=(255, 255, 255), tolerance=30,
+                               progress_callback=None, metric="canal", workers=None):
+    """
+    Camino RGBA de remove_background repartido entre procesos.
+    
+    Los frames se decodifican en un bloque de multiprocessing.shared_memory
+    y un ProcessPoolExecutor los procesa por trozos: cada proceso enmascara
+    sus frames y los cuantiza a paleta (la parte cara de la codificación),
+    escribiendo índices y paletas en otros bloques compartidos; ningún
+    arreglo pasa por pickle. Luego se codifican en orden. El archivo es
+    idéntico byte a byte al de remove_background.
+    
+    La memoria es la de la animación completa (N × H × W × 5 bytes).
+    
+    Args:
+        workers: Cantidad de procesos (None = todos los núcleos)
+        (el resto, igual que remove_background)
+    """
+    workers = workers or os.cpu_count() or 1
+    masker_args = (tuple(bg_color), tolerance, metric)
+    BackgroundMasker(*masker_args)  # Valida la métrica antes de lanzar procesos
+    
+    with Image.open(input_gif) as img:
+        total = getattr(img, 'n_frames', 1)
+        width, height = img.size
+        pixels = total * height * width
+        blocks = []
+        try:
+            for size in (pixels * 4, pixels, total * PALETTE_BYTES, total * 3 * 4):
+                blocks.append(shared_memory.SharedMemory(create=True, size=max(1, size)))
+            _remove_background_shared(img, blocks, (total, height, width), output_gif,
+                                      masker_args, min(workers, total), progress_callback)
+        finally:
+            for block in blocks:
+                try:
+                    block.close()
+                except BufferError:
+                    pass  # Una excepción aún retiene vistas; el bloque se borra igual
+                block.unlink()
+
+
+def remove_background(input_gif, output_gif, bg_color=(255, 255, 255), tolerance=30,
+                      progress_callback=None, metric="canal", streaming=None,
+                      workers=1):
+    """
+    Elimina el fondo de un GIF animado y lo hace transparente.
+    
+    Si todos los frames comparten la paleta global se trabaja con índices
+    (BackgroundMasker.apply_indexed): la tolerancia se prueba sobre los 256
+    colores de la paleta, no sobre cada píxel, y la salida conserva la
+    paleta sin cuantizar. Si no (paletas locales), cada frame se enmascara
+    apenas se decodifica (en un solo arreglo (N, H, W, 4)) y se pasa a
+    paleta sin cuantizar con FramePalettizer.
+    
+    Args:
+        input_gif: Ruta del GIF de entrada
+        output_gif: Ruta del GIF de salida
+        bg_color: Color del fondo a eliminar (R, G, B)
+        tolerance: Tolerancia para la detección del color (0-255)
+        progress_callback: Función para actualizar el progreso
+        metric: Distancia de color, "canal" o "euclidiana" (ver METRICS)
+        streaming: True para procesar de a un frame (remove_background_streaming);
+            None (por defecto) lo decide según el tamaño de la animación
+            decodificada (ver STREAMING_THRESHOLD_BYTES)
+        workers: Procesos para el camino RGBA (remove_background_parallel);
+            1 = sin procesos, None = todos los núcleos. Solo se usan si la
+            animación decodificada supera PARALLEL_THRESHOLD_BYTES; no se
+            usan en modo streaming ni con GIFs indexados (su máscara ya es
+            O(256) por frame)
+    """
+    with Image.open(input_gif) as img:
+        width, height = img.size
+        decoded_bytes = getattr(img, 'n_frames', 1) * width * height * 4
+    if streaming is None:
+        streaming = decoded_bytes > STREAMING_THRESHOLD_BYTES
+    if streaming:
+        try:
+            remove_background_streaming(input_gif, output_gif, bg_color, tolerance,
+                                        progress_callback, metric)
             return
-        
-        tolerance = self.tolerance_var.get()
-        
-        # Preguntar dónde guardar
-        output_file = filedialog.asksaveasfilename(
-            title="Guardar GIF como",
-            defaultextension=".gif",
-            initialfile=os.path.basename(self.output_file),
-            filetypes=[("GIF files", "*.gif"), ("All files", "*.*")]
-        )
-        
-        if not output_file:
+        except PILLOW_INTERNAL_ERRORS as e:
+            print(f"⚠️  Modo streaming no disponible con Pillow {Image.__version__} ({e}); "
+                  f"se procesa en memoria")
+    
+    masker = BackgroundMasker(bg_color, tolerance, metric)
+    with indexed_loading(), Image.open(input_gif) as img:
+        indexed = decode_indexed_frames(img, progress_callback)
+        loop = img.info.get('loop', 0)
+    
+    if indexed is not None:
+        indices, palette, transparency, durations = indexed
+        transparent = masker.apply_indexed(indices, palette, transparency)
+        save_indexed_frames(indices, palette, durations, output_gif, loop=loop,
+                            transparency=transparent)
+        return
+    
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers > 1 and decoded_bytes > PARALLEL_THRESHOLD_BYTES:
+        try:
+            remove_background_parallel(input_gif, output_gif, bg_color, tolerance,
+                                       progress_callback, metric, workers)
             return
-        
+        except PILLOW_INTERNAL_ERRORS as e:
+            print(f"⚠️  Modo en paralelo no disponible con Pillow {Image.__version__} ({e}); "
+                  f"se procesa en serie")
+    
+    with Image.open(input_gif) as img:
+        frames, durations = decode_frames(img, progress_callback, masker)
+        loop = img.info.get('loop', 0)
+    
+    save_frames(frames, durations, output_gif, loop=loop)
+
+
+# --------------------------------------------------------------------
+# Procesamiento en lote (línea de comandos)
+
+OUTPUT_SUFFIX = "_sin_fondo"
+NAMED_COLORS = {"blanco": (255, 255, 255), "verde": (0, 255, 0), "negro": (0, 0, 0)}
+BATCH_CACHE_PATH = CACHE_DIR / "quitar_fondo.json"
+# Subir al cambiar el resultado de remove_background (invalida la caché)
+BATCH_CACHE_VERSION = 1
+
+
+class BatchCache:
+    """
+    Registro de las salidas generadas en lote, para no repetir trabajo.
+    
+    Cada salida guarda el hash del GIF de entrada, los parámetros con que
+    se generó y el tamaño y la fecha de la salida. Un archivo se salta si
+    todo coincide; si la salida se borró o se editó, se vuelve a generar.
+    
+    Args:
+        index_path: Archivo JSON donde se persiste el registro
+    """
+    
+    def __init__(self, index_path=BATCH_CACHE_PATH):
+        self.index_path = Path(index_path)
+        self._entries = {}  # ruta de salida (str) -> dict
+        self._dirty = False
         try:
-            self.btn_process.config(state=tk.DISABLED)
-            self.progress['value'] = 0
-            self.progress_label.config(text="Iniciando...")
-            
-            remove_background(
-                self.input_file,
-                output_file,
-                bg_color=bg_color,
-                tolerance=tolerance,
-                progress_callback=self.update_progress
-            )
-            
-            self.progress['value'] = 100
-            self.progress_label.config(text="¡Completado!", foreground="green")
-            
-            messagebox.showinfo("Éxito", f"GIF guardado exitosamente en:\n{output_file}")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Error al procesar el GIF:\n{str(e)}")
-            self.progress_label.config(text="Error en el proceso", foreground="red")
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == BATCH_CACHE_VERSION:
+                self._entries = dict(data.get("outputs", {}))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            # p. ej. la ruta es una carpeta o cuelga de un archivo
+            print(f"⚠️  No se pudo leer la caché de quitar_fondo, se reconstruye: {e}")
+        except (ValueError, TypeError, AttributeError) as e:
+            print(f"⚠️  Caché de quitar_fondo inválida, se reconstruye: {e}")
+    
+    @staticmethod
+    def _key(output_gif):
+        return str(Path(output_gif).resolve())
+    
+    @staticmethod
+    def _output_stat(output_gif):
+        try:
+            st = os.stat(output_gif)
+        except OSError:
+            return None
+        return [st.st_size, st.st_mtime_ns]
+    
+    def is_fresh(self, output_gif, input_hash, params):
+        """True si la salida existe y se generó desde el mismo contenido y parámetros."""
+        entry = self._entries.get(self._key(output_gif))
+        return (entry is not None
+                and entry.get("input_hash") == input_hash
+                and entry.get("params") == params
+                and entry.get("output") == self._output_stat(output_gif))
+    
+    def record(self, output_gif, input_gif, input_hash, params):
+        self._entries[self._key(output_gif)] = {
+            "input": str(input_gif),
+            "input_hash": input_hash,
+            "params": params,
+            "output": self._output_stat(output_gif),
+        }
+        self._dirty = True
+    
+    def save(self):
+        """
+        Persiste el registro si hubo cambios (escritura atómica).
         
-        finally:
-            self.btn_process.config(state=tk.NORMAL)
+        Igual que AssetCatalog.save: si no se puede escribir, avisa y el
+        registro sigue en memoria (las salidas ya generadas no se tocan).
+        """
+        if not self._dirty:
+            return
+        data = {"version": BATCH_CACHE_VERSION, "outputs": self._entries}
+        tmp_path = self.index_path.with_suffix(".tmp")
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            print(f"⚠️  No se pudo guardar la caché de quitar_fondo: {e}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            return
+        self._dirty = False
+
+
+def expand_inputs(patterns):
+    """
+    GIFs a procesar a partir de carpetas, archivos o patrones glob.
+    
+    Al expandir carpetas y patrones se omiten las salidas anteriores
+    (*_sin_fondo.gif), para que repetir el comando no las procese de nuevo.
+    
+    Returns:
+        Lista ordenada de rutas (sin duplicados)
+    """
+    found = set()
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            candidates = path.iterdir()
+        elif path.is_file():
+            found.add(path)
+            continue
+        else:
+            candidates = (Path(match) for match in glob.glob(pattern))
+        for candidate in candidates:
+            if (candidate.suffix.lower() == ".gif" and candidate.is_file()
+                    and not candidate.stem.endswith(OUTPUT_SUFFIX)):
+                found.add(candidate)
+    return sorted(found)
+
+
+def output_path_for(input_gif, output_dir=None):
+    """<nombre>_sin_fondo.gif junto al original o dentro de output_dir."""
+    input_gif = Path(input_gif)
+    folder = Path(output_dir) if output_dir else input_gif.parent
+    return folder / f"{input_gif.stem}{OUTPUT_SUFFIX}.gif"
+
+
+def parse_color(text):
+    """Color como nombre (blanco, verde, negro) o "R,G,B"."""
+    name = text.strip().lower()
+    if name in NAMED_COLORS:
+        return NAMED_COLORS[name]
+    try:
+        color = tuple(int(part) for part in name.split(","))
+    except ValueError:
+        color = ()
+    if len(color) != 3 or not all(0 <= c <= 255 for c in color):
+        raise argparse.ArgumentTypeError(
+            f"color inválido: {text!r} (usa {', '.join(NAMED_COLORS)} o R,G,B entre 0 y 255)")
+    return color
+
+
+def _process_batch_file(input_gif, output_gif, bg_color, tolerance, metric):
+    """Tarea de un proceso del lote. Retorna el tiempo empleado en ms."""
+    start = time.perf_counter()
+    remove_background(str(input_gif), str(output_gif), bg_color, tolerance, metric=metric)
+    return (time.perf_counter() - start) * 1000
+
+
+def run_batch(inputs, output_dir=None, bg_color=(255, 255, 255), tolerance=30,
+              metric="canal", jobs=None, force=False, cache=None):
+    """
+    Procesa varios GIFs en paralelo (un proceso por archivo).
+    
+    Args:
+        inputs: Rutas de los GIFs (ver expand_inputs)
+        output_dir: Carpeta de salida (None = junto a cada original)
+        jobs: Procesos simultáneos (None = todos los núcleos)
+        force: Procesar aunque la caché diga que la salida está al día
+        cache: BatchCache a usar (None = la de .ram_runner_cache)
+    
+    Returns:
+        (procesados, sin cambios, errores) como cantidades
+    """
+    cache = cache if cache is not None else BatchCache()
+    params = {"bg_color": list(bg_color), "tolerance": tolerance, "metric": metric}
+    if output_dir:
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+    
+    todo = []
+    skipped = errors = 0
+    for input_gif in inputs:
+        output_gif = output_path_for(input_gif, output_dir)
+        try:
+            input_hash = file_content_hash(input_gif)
+        except OSError as e:
+            print(f"❌ {input_gif}: {e}")
+            errors += 1
+            continue
+        if not force and cache.is_fresh(output_gif, input_hash, params):
+            print(f"⏭️  {input_gif} sin cambios")
+            skipped += 1
+            continue
+        todo.append((input_gif, output_gif, input_hash))
+    
+    processed = 0
+    args = (tuple(bg_color), tolerance, metric)
+    
+    def report(task, elapsed_ms=None, error=None):
+        nonlocal processed, errors
+        input_gif, output_gif, input_hash = task
+        if error is not None:
+            print(f"❌ {input_gif}: {error}")
+            errors += 1
+            return
+        cache.record(output_gif, input_gif, input_hash, params)
+        processed += 1
+        print(f"✓ {input_gif} -> {output_gif} ({elapsed_ms:.0f} ms)")
+    
+    jobs = min(jobs or os.cpu_count() or 1, len(todo))
+    try:
+        if jobs > 1:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                futures = {pool.submit(_process_batch_file, task[0], task[1], *args): task
+                           for task in todo}
+                for future in as_completed(futures):
+                    try:
+                        report(futures[future], future.result())
+                    except Exception as e:
+                        report(futures[future], error=e)
+        else:
+            for task in todo:
+                try:
+                    report(task, _process_batch_file(task[0], task[1], *args))
+                except Exception as e:
+                    report(task, error=e)
+    finally:
+        cache.save()
+    return processed, skipped, errors
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Elimina el fondo de GIFs animados en lote (sin argumentos abre la interfaz gráfica).")
+    parser.add_argument("inputs", nargs="+", metavar="entrada",
+                        help="Carpeta, GIF o patrón glob (ej. 'assets/*.gif'); repetible")
+    parser.add_argument("-o", "--output-dir", default=None,
+                        help="Carpeta de salida (por defecto: junto a cada GIF, como <nombre>_sin_fondo.gif)")
+    parser.add_argument("--color", type=parse_color, default=NAMED_COLORS["blanco"],
+                        help="Color del fondo: blanco, verde, negro o R,G,B (por defecto: blanco)")
+    parser.add_argument("--tolerance", type=int, default=30,
+                        help="Tolerancia de color, 0-255 (por defecto: 30)")
+    parser.add_argument("--metric", default="canal", choices=METRICS,
+                        help="Distancia de color (por defecto: canal)")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="Archivos procesados a la vez (por defecto: todos los núcleos)")
+    parser.add_argument("--force", action="store_true",
+                        help="Procesar todo aunque la caché indique que no hubo cambios")
+    args = parser.parse_args(argv)
+    if not 0 <= args.tolerance <= 255:
+        parser.error("--tolerance debe estar entre 0 y 255")
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs debe ser >= 1")
+    return args
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        # Import diferido: tkinter solo se carga cuando se pide la interfaz
+        import quitar_fondo_gui
+        quitar_fondo_gui.main()
+        return 0
+    
+    args = parse_args(argv)
+    inputs = expand_inputs(args.inputs)
+    if not inputs:
+        print("❌ No se encontraron GIFs en las entradas indicadas", file=sys.stderr)
+        return 2
+    
+    outputs = {}
+    for input_gif in inputs:
+        output_gif = output_path_for(input_gif, args.output_dir)
+        if output_gif in outputs:
+            print(f"❌ {input_gif} y {outputs[output_gif]} escribirían el mismo archivo {output_gif}",
+                  file=sys.stderr)
+            return 2
+        outputs[output_gif] = input_gif
+    
+    processed, skipped, errors = run_batch(
+        inputs, args.output_dir, args.color, args.tolerance, args.metric, args.jobs, args.force)
+    print(f"\n{'❌' if errors else '✓'} {processed} procesado(s), {skipped} sin cambios, {errors} error(es)")
+    return 1 if errors else 0
+
+
+def __getattr__(name):
+    # Compatibilidad: la interfaz vivía en este módulo
+    if name == "GifBackgroundRemoverApp":
+        from quitar_fondo_gui import GifBackgroundRemoverApp
+        return GifBackgroundRemoverApp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 if __name__ == "__main__":
-    root = tk.Tk()
-    app = GifBackgroundRemoverApp(root)
-    root.mainloop()
\ No newline at end of file
+    sys.exit(main())
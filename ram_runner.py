@@ -1,17 +1,128 @@
 import sys
-import psutil
-import winreg
+import time
+STARTUP_T0 = time.perf_counter()  # Referencia para medir el tiempo de arranque
+try:
+    import winreg  # Solo existe en Windows (inicio automático)
+except ImportError:
+    winreg = None
 import subprocess
 from pathlib import Path
-from PyQt5.QtWidgets import (QApplication, QLabel, QWidget, QVBoxLayout, 
+from PyQt5.QtWidgets import (QApplication, QWidget,
                               QSystemTrayIcon, QMenu, QAction, QActionGroup)
-from PyQt5.QtCore import QTimer, Qt, QPoint, QRect, QFileSystemWatcher
-from PyQt5.QtGui import QPixmap, QMovie, QColor, QFont, QPainter, QBrush, QIcon, QPainter as QPainterAlias
+from PyQt5.QtCore import QTimer, Qt, QPoint, QRect, QFileSystemWatcher, pyqtSignal
+from PyQt5.QtCore import QRectF
+from PyQt5.QtGui import QPixmap, QColor, QFont, QPainter, QBrush, QIcon
+
+from asset_catalog import CACHE_DIR, AssetCatalog
+from diagnostics import Diagnostics
+from frame_cache import AsyncFrameLoader, FrameCache
+from frame_clock import FrameClock
+from frame_playback import DEFAULT_MAX_FPS, PlaybackCursor
+from metric_history import MetricHistory
+from metric_providers import DEFAULT_PROVIDER, available_providers
+from ram_sampler import MetricSampler
+from speed_curve import DEFAULT_PRESET, PRESETS, SpeedController
+from thumbnails import ThumbnailService
+
+class SparklineWidget(QWidget):
+    """
+    Gráfico de tendencia de la métrica debajo del runner.
+    
+    Dibuja sobre un pixmap propio: cada muestra nueva desplaza el pixmap una
+    columna a la izquierda y solo se pinta la columna nueva. El historial
+    completo solo se redibuja al cambiar de tamaño.
+    """
+    
+    def __init__(self, history, parent=None):
+        super().__init__(parent)
+        self.history = history
+        self.line_color = QColor(0, 200, 255, 220)
+        self.canvas = QPixmap()
+        self.last_y = None
+        self.setAttribute(Qt.WA_TranslucentBackground)
+    
+    def value_to_y(self, value):
+        """Convierte un porcentaje (0-100) en coordenada vertical."""
+        height = self.canvas.height()
+        value = min(100.0, max(0.0, value))
+        return (height - 1) - value / 100.0 * (height - 1)
+    
+    def add_sample(self, value):
+        """Desplaza el gráfico una columna y dibuja solo la nueva muestra."""
+        if self.canvas.isNull():
+            return
+        width = self.canvas.width()
+        self.canvas.scroll(-1, 0, self.canvas.rect())
+        
+        painter = QPainter(self.canvas)
+        painter.setCompositionMode(QPainter.CompositionMode_Source)
+        painter.fillRect(width - 1, 0, 1, self.canvas.height(), Qt.transparent)
+        painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+        painter.setPen(self.line_color)
+        y = self.value_to_y(value)
+        previous_y = y if self.last_y is None else self.last_y
+        painter.drawLine(QPoint(width - 2, int(previous_y)), QPoint(width - 1, int(y)))
+        painter.end()
+        
+        self.last_y = y
+        self.update(width - 2, 0, 2, self.height())
+        self.update_tooltip()
+    
+    def update_tooltip(self):
+        """Mínimo, máximo y media (ya calculados de forma incremental)."""
+        if not len(self.history):
+            self.setToolTip("")
+            return
+        minutes = len(self.history) / 60.0
+        self.setToolTip(
+            f"Últimos {minutes:.0f} min\n"
+            f"Mín: {self.history.minimum:.1f}%\n"
+            f"Máx: {self.history.maximum:.1f}%\n"
+            f"Media: {self.history.mean:.1f}%"
+        )
+    
+    def redraw(self):
+        """Redibuja todo el gráfico desde el historial (solo al redimensionar)."""
+        if self.width() <= 0 or self.height() <= 0:
+            return
+        self.canvas = QPixmap(self.width(), self.height())
+        self.canvas.fill(Qt.transparent)
+        self.last_y = None
+        
+        values = self.history.tail(self.width())
+        if len(values):
+            painter = QPainter(self.canvas)
+            painter.setPen(self.line_color)
+            x0 = self.width() - len(values)
+            previous_y = self.value_to_y(values[0])
+            for i, value in enumerate(values):
+                y = self.value_to_y(value)
+                painter.drawLine(QPoint(x0 + i - 1, int(previous_y)), QPoint(x0 + i, int(y)))
+                previous_y = y
+            painter.end()
+            self.last_y = previous_y
+        self.update()
+        self.update_tooltip()
+    
+    def resizeEvent(self, event):
+        self.redraw()
+        super().resizeEvent(event)
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.drawPixmap(event.rect(), self.canvas, event.rect())
+
 
 class RAMRunnerWidget(QWidget):
-    def __init__(self, parent_app):
+    first_painted = pyqtSignal()
+    
+    def __init__(self, parent_app, frame_cache=None, sampler=None, providers=None,
+                 clock=None, runner_id=0):
         super().__init__()
         self.parent_app = parent_app
+        self.runner_id = runner_id
+        # Frames ya decodificados y escalados (compartidos con la app)
+        self.frame_cache = frame_cache if frame_cache is not None else FrameCache()
         
         # --- Configuración de la ventana ---
         # IMPORTANTE: Estas banderas hacen que la ventana esté SIEMPRE encima
@@ -39,58 +150,118 @@ class RAMRunnerWidget(QWidget):
         self.MAX_INTERVAL_MS = 300  # Velocidad base más rápida
         self.MIN_INTERVAL_MS = 30   # Velocidad máxima más controlada
         
-        # --- Variables para efecto RGB ---
-        self.rgb_hue = 0
-        
-        # --- Layout ---
-        layout = QVBoxLayout()
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(5)
+        # --- Curva de velocidad (tabla precalculada + suavizado EMA) ---
+        self.speed = SpeedController(
+            max_interval_ms=self.MAX_INTERVAL_MS,
+            min_interval_ms=self.MIN_INTERVAL_MS,
+        )
+        self.speed_preset = DEFAULT_PRESET
         
-        # --- Label para el GIF ---
-        self.gif_label = QLabel(self)
-        self.gif_label.setAlignment(Qt.AlignCenter)
-        self.gif_label.setScaledContents(True)
+        # --- Variables para efecto RGB ---
+        self.RGB_HUE_STEP = 2  # Grados de tono que avanza cada tick
+        self.rgb_index = 0
+        
+        # --- Superficie única ---
+        # Frame, texto y punto de redimensionado se pintan en un solo back
+        # buffer (self.surface); cada cambio redibuja solo su banda en el
+        # buffer y marca ese rectángulo como sucio (ver mark_dirty).
+        # Distribución vertical: frame | SPACING | gráfico | SPACING | texto
+        self.SPACING = 5
+        self.TEXT_HEIGHT = 35
+        self.surface = QPixmap()
         
         # --- Cargar GIF inicial ---
-        self.movie = None
+        self.gif = None  # DecodedGif actual (frames + retardos)
+        self.frame_index = 0
+        # Reproducción por tiempo: el cursor decide qué frame toca y los
+        # intermedios se saltan; nunca se pinta a más de max_fps
+        self.playback = None
+        self.last_frame_tick_ms = None
+        screen = QApplication.primaryScreen()
+        refresh = screen.refreshRate() if screen else 0
+        self.max_fps = min(DEFAULT_MAX_FPS, refresh) if refresh >= 1 else DEFAULT_MAX_FPS
+        self.speed_percent = 100  # Porcentaje de velocidad (100 = velocidad original)
         self.current_gif_path = None
         
-        # --- Label para el texto de RAM ---
-        self.ram_label = QLabel("RAM: 0.0%", self)
-        self.ram_label.setAlignment(Qt.AlignCenter)
-        self.ram_label.setFont(QFont("Arial", 16, QFont.Bold))
-        self.ram_label.setStyleSheet("""
-            QLabel {
-                background-color: transparent;
-                color: #FF0000;
-                padding: 5px;
-            }
-        """)
-        
-        # --- Agregar widgets al layout ---
-        layout.addWidget(self.gif_label)
-        layout.addWidget(self.ram_label)
-        
-        self.setLayout(layout)
-        
-        # --- Timer para actualizar RAM ---
-        self.update_timer = QTimer(self)
-        self.update_timer.timeout.connect(self.update_ram_display)
-        self.update_timer.start(100)
-        
-        # --- Timer para efecto RGB ---
-        self.rgb_timer = QTimer(self)
-        self.rgb_timer.timeout.connect(self.update_rgb_color)
-        self.rgb_timer.start(50)
-        
-        # --- Timer para mantener la ventana siempre encima ---
-        # Este timer refresca constantemente la prioridad de la ventana
-        self.top_timer = QTimer(self)
-        self.top_timer.timeout.connect(self.force_on_top)
-        self.top_timer.start(1000)  # Cada segundo reafirma que está encima
+        # --- Texto de RAM ---
+        self.ram_text = "RAM: 0.0%"
+        self.text_font = QFont("Arial", 16, QFont.Bold)
+        self.text_mask = QPixmap()  # Texto ya rasterizado; el color se aplica encima
+        self.placeholder_font = QFont()
+        self.placeholder_font.setPixelSize(72)
+        self.rgb_colors = self.build_rgb_colors()
+        
+        # --- Punto rojo de redimensionado (se dibuja una sola vez) ---
+        self.handle_pixmap = self.build_handle_pixmap()
+        
+        # --- Historial de la métrica (varias horas) y gráfico de tendencia ---
+        # El gráfico sigue siendo un hijo: ya se actualiza columna a columna
+        self.SPARKLINE_HEIGHT = 24
+        self.history = MetricHistory(capacity=4 * 3600)  # 4 h a 1 muestra/s
+        self.sparkline = SparklineWidget(self.history, self)
+        
+        # --- Muestreo de RAM en segundo plano ---
+        # El hilo del sampler hace la lectura (psutil / /proc); la interfaz
+        # solo consulta la última muestra y nunca espera por E/S.
+        # La métrica que controla la velocidad se elige en el menú (Métrica).
+        # Con varios widgets la app comparte un solo sampler entre todos.
+        self.providers = providers if providers is not None else available_providers()
+        self.metric_key = DEFAULT_PROVIDER
+        self.owns_sampler = sampler is None
+        if self.owns_sampler:
+            sampler = MetricSampler([self.providers[self.metric_key]],
+                                    min_interval=0.1, max_interval=1.0)
+            sampler.start()
+        self.sampler = sampler
+        
+        # --- Redimensionado en dos fases ---
+        # Durante el arrastre la geometría se aplica como mucho una vez cada
+        # 16 ms y el frame se muestra con un escalado rápido (vista previa).
+        # Cuando el arrastre se asienta, todos los frames se re-escalan con
+        # alta calidad en un hilo de trabajo.
+        # El mismo hilo decodifica los GIFs nuevos (load_gif): solo vale la
+        # última petición y las anteriores se cancelan.
+        self.frame_loader = AsyncFrameLoader(self.frame_cache, self)
+        self.frame_loader.ready.connect(self.on_frames_ready)
+        self.pending_frames_token = None
+        self.pending_gif_path = None  # GIF que se está abriendo (cambio de runner)
+        
+        self.resize_apply_timer = QTimer(self)
+        self.resize_apply_timer.setSingleShot(True)
+        self.resize_apply_timer.setInterval(16)
+        self.resize_apply_timer.timeout.connect(self.update_size)
+        
+        self.resize_settle_timer = QTimer(self)
+        self.resize_settle_timer.setSingleShot(True)
+        self.resize_settle_timer.setInterval(150)
+        self.resize_settle_timer.timeout.connect(self.request_scaled_frames)
+        
+        # --- Diagnóstico (histogramas de latencia y frames tardíos) ---
+        self.diagnostics = Diagnostics()
+        timed = self.diagnostics.timed
+        
+        # --- Reloj único para todos los subsistemas ---
+        # Un solo temporizador despierta al proceso y reparte el tick entre
+        # lectura de RAM, color, prioridad de ventana y avance de frames.
+        # Con varios widgets el reloj es de la app: cada widget registra sus
+        # subsistemas con su propio sufijo (ver subsystem).
+        self.clock = clock if clock is not None else FrameClock(self)
+        self.clock.register(self.subsystem("ram"), 100,
+                            timed("update_ram_display", self.update_ram_display))
+        self.clock.register(self.subsystem("rgb"), 50,
+                            timed("update_rgb_color", self.update_rgb_color))
+        # Cada segundo reafirma que la ventana está encima
+        self.clock.register(self.subsystem("top"), 1000,
+                            timed("force_on_top", self.force_on_top))
+        # Una muestra por segundo al historial / gráfico de tendencia
+        self.clock.register(self.subsystem("history"), 1000,
+                            timed("record_history", self.record_history))
+        
+        # --- Medición del arranque (ms desde STARTUP_T0) ---
+        self.startup_marks = {}
         
         # --- Configuración inicial ---
+        self.show_placeholder()
         self.update_size()
         self.move(100, 100)
         
@@ -102,60 +273,267 @@ class RAMRunnerWidget(QWidget):
         print("  • Busca el icono en la bandeja del sistema")
         print("=" * 40)
     
+    def subsystem(self, name):
+        """Nombre del subsistema de este widget en el reloj (compartido o no)."""
+        return f"{name}@{self.runner_id}"
+    
+    @property
+    def target_gif_path(self):
+        """GIF que se está abriendo o, si no hay ninguno, el que se muestra."""
+        return self.pending_gif_path or self.current_gif_path
+    
     def load_gif(self, gif_path):
-        """Carga un GIF específico."""
-        if self.movie:
-            self.movie.stop()
+        """
+        Carga un GIF específico.
         
+        Si sus frames ya están en la caché se muestra de inmediato; si no, se
+        abre y decodifica en segundo plano mientras sigue el GIF actual (o el
+        marcador de posición). Una carga nueva cancela la anterior.
+        """
+        self.cancel_pending_frames()
         gif_path = Path(gif_path)
-        
-        if gif_path.exists():
-            self.movie = QMovie(str(gif_path))
-            self.gif_label.setMovie(self.movie)
-            self.movie.start()
-            self.current_gif_path = str(gif_path)
-            print(f"✓ GIF cargado: {gif_path.name}")
-        else:
-            self.gif_label.setText("🦜")
-            self.gif_label.setStyleSheet("""
-                QLabel {
-                    font-size: 72px;
-                    background-color: rgba(50, 50, 50, 200);
-                    border-radius: 10px;
-                    padding: 20px;
-                }
-            """)
-            self.movie = None
+        if not gif_path.exists():
+            if not self.gif:
+                self.show_placeholder()
             print(f"⚠️  GIF no encontrado: {gif_path}")
+            return
+        
+        size = (self.current_width, self.current_height)
+        if (str(gif_path), *size) in self.frame_cache:
+            self.apply_gif(self.frame_cache.get(gif_path, *size))
+            return
+        
+        if not self.gif:
+            self.show_placeholder()
+        self.pending_gif_path = str(gif_path)
+        self.pending_frames_token = self.frame_loader.request(gif_path, *size)
+    
+    def cancel_pending_frames(self):
+        """Cancela la decodificación en curso (GIF nuevo o re-escalado)."""
+        if self.pending_frames_token is not None:
+            self.frame_loader.cancel(self.pending_frames_token)
+        self.pending_frames_token = None
+        self.pending_gif_path = None
+    
+    def apply_gif(self, gif):
+        """Empieza a reproducir un GIF ya decodificado."""
+        # Los frames se avanzan desde el subsistema "frames" del reloj
+        self.gif = gif
+        self.frame_index = 0
+        self.playback = PlaybackCursor(gif.delays)
+        self.last_frame_tick_ms = time.monotonic() * 1000.0
+        self.show_current_frame()
+        self.diagnostics.frames.restart()
+        self.clock.register(self.subsystem("frames"), self.frame_period_ms(),
+                            self.diagnostics.timed("advance_frame", self.advance_frame),
+                            coalesce=False)
+        self.current_gif_path = gif.path
+        print(f"✓ GIF cargado: {Path(gif.path).name}")
+    
+    def show_placeholder(self):
+        """Muestra el marcador de posición (sin GIF cargado todavía)."""
+        self.clock.unregister(self.subsystem("frames"))
+        self.gif = None
+        self.playback = None
+        self.draw_frame_band()
+    
+    def mark_startup(self, name, message):
+        """Registra (una sola vez) un hito del arranque desde STARTUP_T0."""
+        if name in self.startup_marks:
+            return
+        elapsed_ms = (time.perf_counter() - STARTUP_T0) * 1000
+        self.startup_marks[name] = elapsed_ms
+        if self.runner_id == 0:  # Los widgets agregados después no son el arranque
+            print(f"⏱  {message}: {elapsed_ms:.0f} ms")
     
     def update_size(self):
-        """Actualiza el tamaño de la ventana y los widgets."""
-        total_height = self.current_height + 40
+        """Actualiza el tamaño de la ventana y rehace el back buffer."""
+        total_height = (self.current_height + self.SPACING + self.SPARKLINE_HEIGHT
+                        + self.SPACING + self.TEXT_HEIGHT)
         self.setFixedSize(self.current_width, total_height)
-        self.gif_label.setFixedSize(self.current_width, self.current_height)
+        self.sparkline.setGeometry(0, self.current_height + self.SPACING,
+                                   self.current_width, self.SPARKLINE_HEIGHT)
+        
+        ratio = self.devicePixelRatioF()
+        self.surface = QPixmap(int(self.current_width * ratio), int(total_height * ratio))
+        self.surface.setDevicePixelRatio(ratio)
+        self.surface.fill(Qt.transparent)
+        self.text_mask = QPixmap()
+        self.draw_frame_band()
+        self.draw_text_band()
+    
+    # --- Back buffer ---
+    def frame_rect(self):
+        return QRect(0, 0, self.current_width, self.current_height)
+    
+    def text_rect(self):
+        return QRect(0, self.height() - self.TEXT_HEIGHT, self.current_width, self.TEXT_HEIGHT)
+    
+    def begin_band(self, rect):
+        """Painter sobre el buffer con la banda `rect` ya borrada (transparente)."""
+        painter = QPainter(self.surface)
+        painter.setCompositionMode(QPainter.CompositionMode_Source)
+        painter.fillRect(rect, Qt.transparent)
+        painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+        painter.setClipRect(rect)
+        return painter
+    
+    def mark_dirty(self, rect):
+        """Solo el rectángulo que cambió se vuelve a componer en pantalla."""
+        self.update(rect)
+    
+    def draw_frame_band(self):
+        """Dibuja en el buffer el frame actual (o el marcador de posición)."""
+        if self.surface.isNull():
+            return
+        rect = self.frame_rect()
+        painter = self.begin_band(rect)
+        if self.gif:
+            pixmap = self.gif.frames[self.frame_index]
+            if (self.gif.width, self.gif.height) != (self.current_width, self.current_height):
+                # Vista previa mientras llegan los frames re-escalados
+                painter.setRenderHint(QPainter.SmoothPixmapTransform, False)
+                painter.drawPixmap(rect, pixmap)
+            else:
+                painter.drawPixmap(0, 0, pixmap)
+        else:
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(50, 50, 50, 200))
+            painter.drawRoundedRect(QRectF(rect), 10, 10)
+            painter.setFont(self.placeholder_font)
+            painter.setPen(QColor(255, 255, 255))
+            painter.drawText(rect, Qt.AlignCenter, "🦜")
+        painter.end()
+        self.mark_dirty(rect)
+    
+    def render_text_mask(self):
+        """Rasteriza el texto una vez por valor; los ticks de color solo lo tiñen."""
+        rect = self.text_rect()
+        ratio = self.surface.devicePixelRatio()
+        mask = QPixmap(int(rect.width() * ratio), int(rect.height() * ratio))
+        mask.setDevicePixelRatio(ratio)
+        mask.fill(Qt.transparent)
+        painter = QPainter(mask)
+        painter.setFont(self.text_font)
+        painter.setPen(Qt.white)
+        painter.drawText(QRect(0, 0, rect.width(), rect.height()).adjusted(5, 5, -5, -5),
+                         Qt.AlignCenter, self.ram_text)
+        painter.end()
+        self.text_mask = mask
+    
+    def draw_text_band(self):
+        """Dibuja en el buffer el texto de la métrica y el punto de redimensionado."""
+        if self.surface.isNull():
+            return
+        if self.text_mask.isNull():
+            self.render_text_mask()
+        rect = self.text_rect()
+        painter = self.begin_band(rect)
+        painter.drawPixmap(rect.topLeft(), self.text_mask)
+        # Tiñe solo los píxeles del texto con el color actual del arcoíris
+        painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
+        painter.fillRect(rect, self.rgb_colors[self.rgb_index])
+        painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+        painter.drawPixmap(self.get_resize_handle_rect(), self.handle_pixmap)
+        painter.end()
+        self.mark_dirty(rect)
+    
+    def show_current_frame(self):
+        """Muestra el frame actual; si aún no hay frames a este tamaño, vista previa rápida."""
+        if not self.gif:
+            return
+        self.draw_frame_band()
+    
+    def request_scaled_frames(self):
+        """Fase 2 del redimensionado: frames de alta calidad al tamaño actual."""
+        if not self.gif or self.pending_gif_path:
+            return  # Un GIF nuevo en camino se re-escala al llegar
+        size = (self.current_width, self.current_height)
+        if (self.gif.width, self.gif.height) == size:
+            return
+        self.cancel_pending_frames()
+        if (self.gif.path, *size) in self.frame_cache:
+            self.set_frames(self.frame_cache.get(self.gif.path, *size))
+        else:
+            self.pending_frames_token = self.frame_loader.request(self.gif.path, *size)
+    
+    def on_frames_ready(self, token, gif):
+        """Llega el resultado del hilo de trabajo (ya guardado en la caché)."""
+        if token != self.pending_frames_token:
+            return  # Petición obsoleta
+        self.pending_frames_token = None
+        loading = self.pending_gif_path
+        if loading:
+            # Cambio de runner: solo se aplica la última selección
+            self.pending_gif_path = None
+            if gif is None:
+                print(f"⚠️  No se pudo abrir el GIF: {Path(loading).name}")
+                return
+            self.apply_gif(gif)
+            # Si el widget cambió de tamaño mientras tanto, re-escalar
+            self.request_scaled_frames()
+            return
+        if (gif and self.gif and gif.path == self.gif.path
+                and (gif.width, gif.height) == (self.current_width, self.current_height)):
+            self.set_frames(gif)
+    
+    def set_frames(self, gif):
+        """Reemplaza los frames del GIF actual conservando la posición de la animación."""
+        self.gif = gif
+        self.frame_index %= len(gif)
+        self.show_current_frame()
+    
+    def build_rgb_colors(self):
+        """
+        Precalcula un color por cada paso de tono del efecto arcoíris.
+        
+        Con RGB_HUE_STEP = 2 son 180 colores (tonos 0, 2, ..., 358). Se crean
+        una sola vez; antes cada tick formateaba y aplicaba una hoja de estilos
+        nueva, lo que obligaba a Qt a re-parsear el CSS y re-pulir el widget.
+        """
+        return [QColor.fromHsv(hue, 255, 255) for hue in range(0, 360, self.RGB_HUE_STEP)]
+    
+    def build_handle_pixmap(self):
+        """Punto rojo de redimensionado, dibujado (con antialiasing) una sola vez."""
+        size = self.resize_handle_size
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(int(size * ratio), int(size * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setBrush(QBrush(QColor(255, 0, 0, 200)))
+        painter.setPen(Qt.NoPen)
+        painter.drawEllipse(0, 0, size, size)
+        painter.end()
+        return pixmap
+    
+    @property
+    def rgb_hue(self):
+        """Tono actual del texto (0-359)."""
+        return self.rgb_index * self.RGB_HUE_STEP
     
     def update_rgb_color(self):
         """Actualiza el color RGB del texto (efecto arcoíris)."""
-        self.rgb_hue += 2
-        if self.rgb_hue >= 360:
-            self.rgb_hue = 0
-        
-        color = QColor.fromHsv(self.rgb_hue, 255, 255)
-        rgb_string = f"rgb({color.red()}, {color.green()}, {color.blue()})"
-        
-        self.ram_label.setStyleSheet(f"""
-            QLabel {{
-                background-color: transparent;
-                color: {rgb_string};
-                padding: 5px;
-            }}
-        """)
+        # Solo avanza el índice en la tabla de colores y redibuja la banda
+        # del texto: el frame no se vuelve a componer.
+        self.rgb_index = (self.rgb_index + 1) % len(self.rgb_colors)
+        self.draw_text_band()
     
     def update_ram_display(self):
         """Actualiza el display de RAM y ajusta la velocidad del GIF."""
-        ram_percent = psutil.virtual_memory().percent
-        
-        self.ram_label.setText(f"RAM: {ram_percent:.1f}%")
+        ram_percent = self.sampler.latest_value(self.metric_key)
+        if ram_percent is None:
+            return  # Todavía no hay muestras
+        
+        label = self.providers[self.metric_key].label
+        text = f"{label}: {ram_percent:.1f}%"
+        if text != self.ram_text:
+            # Sin cambios visibles no se redibuja nada
+            self.ram_text = text
+            self.text_mask = QPixmap()
+            self.draw_text_band()
         
         # ====================================================================
         # AJUSTE DE VELOCIDAD DEL GIF SEGÚN USO DE RAM
@@ -178,9 +556,79 @@ class RAMRunnerWidget(QWidget):
         # self.MIN_INTERVAL_MS = 20   # Velocidad máxima muy rápida
         # ====================================================================
         
-        if self.movie:
-            interval_ms = self.calculate_animation_interval(ram_percent)
-            self.movie.setSpeed(int((self.MAX_INTERVAL_MS / interval_ms) * 100))
+        # La velocidad solo cambia si difiere de forma apreciable de la
+        # actual (histéresis); el frame siguiente ya usa el nuevo valor.
+        if self.speed.update(ram_percent):
+            self.speed_percent = self.speed.speed_percent
+    
+    def record_history(self):
+        """Subsistema "history": agrega la última lectura al historial."""
+        value = self.sampler.latest_value(self.metric_key)
+        if value is None:
+            return
+        self.history.append(value)
+        self.sparkline.add_sample(value)
+    
+    def set_metric(self, key):
+        """Cambia la métrica que se muestra y controla la velocidad."""
+        if key == self.metric_key or key not in self.providers:
+            return
+        self.metric_key = key
+        if self.owns_sampler:
+            self.sampler.set_providers([self.providers[key]])
+        elif self.parent_app:
+            self.parent_app.sync_sampler_providers()
+        # Empezar el suavizado y el historial de cero con la nueva métrica
+        self.speed.smoothed_percent = None
+        self.history.clear()
+        self.sparkline.redraw()
+        print(f"✓ Métrica: {self.providers[key].title}")
+    
+    def set_speed_curve(self, preset):
+        """Cambia la curva de velocidad por una de speed_curve.PRESETS."""
+        self.speed.set_curve(PRESETS[preset]())
+        self.speed_preset = preset
+        # Aplicar de inmediato con el último valor suavizado
+        if self.speed.smoothed_percent is not None:
+            self.speed.speed_percent = self.speed.speed_for(self.speed.smoothed_percent)
+            self.speed_percent = self.speed.speed_percent
+    
+    def frame_period_ms(self):
+        """Tiempo hasta el próximo cambio de frame, sin bajar del límite de FPS."""
+        min_period = 1000.0 / self.max_fps
+        if not self.playback:
+            return max(min_period, 100.0)
+        return max(min_period, self.playback.time_to_next_ms(self.speed_percent / 100.0))
+    
+    def restart_playback(self):
+        """Retoma la reproducción sin "recuperar" el tiempo que estuvo pausada."""
+        self.last_frame_tick_ms = time.monotonic() * 1000.0
+        self.diagnostics.frames.restart()
+    
+    def advance_frame(self):
+        """Subsistema "frames": muestra el frame que toca según el tiempo transcurrido."""
+        if not self.gif:
+            return
+        now_ms = time.monotonic() * 1000.0
+        elapsed = now_ms - self.last_frame_tick_ms
+        self.last_frame_tick_ms = now_ms
+        speed = self.speed_percent / 100.0
+        steps = self.playback.advance(elapsed, speed)
+        # Hasta el próximo cambio según los retardos declarados (escalados)
+        remaining = self.playback.time_to_next_ms(speed)
+        if steps:
+            # Con velocidad alta se saltan frames: solo se pinta el último
+            self.frame_index = self.playback.index
+            self.show_current_frame()
+            if "first_frame" not in self.startup_marks:
+                self.mark_startup("first_frame", "Primer frame animado")
+            self.diagnostics.frames.frame_shown(now_ms, remaining, skipped=steps - 1)
+            period = max(1000.0 / self.max_fps, remaining)
+        else:
+            # Activación apenas antes del cambio (redondeo del temporizador):
+            # nada que pintar, se programa justo para el cambio
+            period = remaining
+        self.clock.set_period(self.subsystem("frames"), period)
     
     def calculate_animation_interval(self, ram_percent):
         """
@@ -190,43 +638,25 @@ class RAMRunnerWidget(QWidget):
         ---------------------------------------
         ram_percent: Porcentaje de RAM usado (0-100)
         
-        Comportamiento actual:
+        Comportamiento por defecto (curva cuadrática):
         - 0-50% RAM: Velocidad normal (cambio gradual)
         - 50-70% RAM: Velocidad moderada
-        - 70-100% RAM: Acelera notablemente (curva cuadrática)
+        - 70-100% RAM: Acelera notablemente
         
         AJUSTES POSIBLES:
         -----------------
-        1. Para hacer que 50-70% sea más lento:
-           curved_percent = normalized_percent ** 1.5
-        
-        2. Para hacer que acelere más suave en todo el rango:
-           curved_percent = normalized_percent ** 1
-           (esto elimina la curva, aceleración lineal)
+        La curva se elige en el menú de la bandeja (Curva) o por código con
+        uno de los presets de speed_curve.PRESETS:
         
-        3. Para que acelere solo después del 80%:
-           if normalized_percent < 0.8:
-               curved_percent = normalized_percent * 0.5
-           else:
-               curved_percent = ((normalized_percent - 0.8) / 0.2) ** 2
+        1. "moderada":   x ** 1.5  (50-70% más lento)
+        2. "lineal":     x         (aceleración uniforme)
+        3. "umbral":     casi plana hasta 80%, cuadrática después
+        4. "cubica":     x ** 3    (solo se nota al 90%+)
         
-        4. Para que sea siempre rápido y solo se note al 90%+:
-           curved_percent = normalized_percent ** 3
+        O con puntos de control propios:
+           self.speed.set_curve(SpeedCurve.from_points([(0, 0), (0.7, 0.2), (1, 1)]))
         """
-        normalized_percent = ram_percent / 100.0
-        
-        # Curva cuadrática: acelera más notablemente después del 70%
-        curved_percent = normalized_percent ** 2
-        
-        # Si quieres probar diferentes curvas, comenta la línea de arriba
-        # y descomenta una de estas:
-        
-        # curved_percent = normalized_percent ** 1.5  # Aceleración moderada
-        # curved_percent = normalized_percent ** 1    # Aceleración lineal
-        # curved_percent = normalized_percent ** 3    # Aceleración muy marcada al final
-        
-        interval_ms = (self.MAX_INTERVAL_MS - self.MIN_INTERVAL_MS) * (1.0 - curved_percent) + self.MIN_INTERVAL_MS
-        return interval_ms
+        return self.speed.interval_ms(ram_percent)
     
     def force_on_top(self):
         """Fuerza a que la ventana esté siempre encima de todo."""
@@ -244,20 +674,25 @@ class RAMRunnerWidget(QWidget):
         )
     
     def paintEvent(self, event):
-        """Dibuja el punto rojo en la esquina inferior derecha."""
-        super().paintEvent(event)
+        """Copia a pantalla solo la región sucia del back buffer."""
+        start = time.perf_counter()
+        if "first_paint" not in self.startup_marks:
+            self.mark_startup("first_paint", "Primer pintado")
+            QTimer.singleShot(0, self.first_painted.emit)
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        painter.setBrush(QBrush(QColor(255, 0, 0, 200)))
-        painter.setPen(Qt.NoPen)
-        
-        handle_rect = self.get_resize_handle_rect()
-        painter.drawEllipse(handle_rect)
+        rect = event.rect()
+        ratio = self.surface.devicePixelRatio()
+        source = QRectF(rect.x() * ratio, rect.y() * ratio,
+                        rect.width() * ratio, rect.height() * ratio)
+        painter.drawPixmap(QRectF(rect), self.surface, source)
+        painter.end()
+        self.diagnostics.record("paintEvent", start)
     
     # --- Eventos del mouse ---
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
+            if self.parent_app:
+                self.parent_app.set_active_widget(self)
             handle_rect = self.get_resize_handle_rect()
             
             if handle_rect.contains(event.pos()):
@@ -268,7 +703,9 @@ class RAMRunnerWidget(QWidget):
                 self.drag_position = event.globalPos() - self.frameGeometry().topLeft()
             event.accept()
         elif event.button() == Qt.RightButton:
-            # Clic derecho muestra el menú del tray
+            # Clic derecho muestra el menú del tray (aplicado a este widget)
+            if self.parent_app:
+                self.parent_app.set_active_widget(self)
             if self.parent_app and self.parent_app.tray_icon:
                 menu = self.parent_app.tray_icon.contextMenu()
                 if menu:
@@ -287,7 +724,12 @@ class RAMRunnerWidget(QWidget):
             self.current_width = new_width
             self.current_height = new_height
             
-            self.update_size()
+            # La geometría se aplica con el próximo tick del temporizador
+            # (se agrupan los movimientos) y el re-escalado fino espera a
+            # que el arrastre se asiente.
+            if not self.resize_apply_timer.isActive():
+                self.resize_apply_timer.start()
+            self.resize_settle_timer.start()
             self.drag_position = event.globalPos()
             event.accept()
             
@@ -297,47 +739,285 @@ class RAMRunnerWidget(QWidget):
     
     def mouseReleaseEvent(self, event):
         if event.button() == Qt.LeftButton:
+            if self.resizing:
+                self.resize_apply_timer.stop()
+                self.resize_settle_timer.stop()
+                self.update_size()
+                self.request_scaled_frames()
             self.dragging = False
             self.resizing = False
+    
+    def closeEvent(self, event):
+        """Detiene el hilo de muestreo (si es propio) y los subsistemas del reloj."""
+        for name in ("ram", "rgb", "top", "history", "frames"):
+            self.clock.unregister(self.subsystem(name))
+        if self.owns_sampler:
+            self.sampler.stop()
+        self.frame_loader.shutdown()
+        super().closeEvent(event)
 
 
 class RAMRunnerApp:
-    def __init__(self):
+    def __init__(self, catalog=None):
         self.app = QApplication(sys.argv)
         self.app.setQuitOnLastWindowClosed(False)
         
-        # --- Widget principal ---
-        self.widget = RAMRunnerWidget(self)
+        # --- Catálogo de GIFs (índice persistente en disco) ---
+        # Se carga después del primer pintado (ver finish_startup)
+        self.catalog = catalog if catalog is not None else AssetCatalog()
+        
+        # --- Caché de frames decodificados (compartida) ---
+        self.frame_cache = FrameCache(budget_bytes=64 * 1024 * 1024)
+        
+        # --- Recursos compartidos por todos los widgets ---
+        # Un solo hilo de muestreo lee las métricas que usan los widgets y un
+        # solo reloj los anima; dos widgets con el mismo GIF y tamaño usan
+        # los mismos frames de la caché.
+        self.providers = available_providers()
+        self.sampler = MetricSampler([self.providers[DEFAULT_PROVIDER]],
+                                     min_interval=0.1, max_interval=1.0)
+        self.sampler.start()
+        self.clock = FrameClock(self.app)
+        
+        # --- Widgets (uno por monitor, o los que se agreguen desde la bandeja) ---
+        # `self.widget` es el widget activo: el que controlan los menús
+        self.widgets = []
+        self.next_runner_id = 0
+        self.widget = self.create_widget()
+        
+        # --- System Tray Icon (se crea en finish_startup) ---
+        self.tray_icon = None
+        self.gif_actions = {}  # ruta -> QAction del submenú Runner
+        self.thumbnails = ThumbnailService()
+        self.thumbnails.ready.connect(self.on_thumbnail_ready)
+        # Precarga en su propio hilo: no retrasa los GIFs que pide el usuario
+        self.prefetch_loader = AsyncFrameLoader(self.frame_cache, self.app)
+        self.prefetch_loader.ready.connect(self.on_prefetch_ready)
+        self.prefetch_queue = []
+        self.prefetch_token = None
+        
+        # --- Arranque rápido ---
+        # El widget se muestra ya con el marcador de posición; el escaneo de
+        # assets, el primer GIF, el menú y el registro se hacen después del
+        # primer pintado, desde el bucle de eventos.
+        self.startup_finished = False
+        self.widget.first_painted.connect(self.finish_startup)
+        self.widget.show()
+        # Por si el widget no llega a pintarse (p. ej. sin pantalla)
+        QTimer.singleShot(500, self.finish_startup)
+    
+    def create_widget(self):
+        """Crea un widget más que comparte sampler, reloj y caché de frames."""
+        widget = RAMRunnerWidget(self, self.frame_cache, sampler=self.sampler,
+                                 providers=self.providers, clock=self.clock,
+                                 runner_id=self.next_runner_id)
+        self.next_runner_id += 1
+        self.widgets.append(widget)
+        return widget
+    
+    def add_widget(self):
+        """Agrega un widget que empieza reflejando al activo (GIF, métrica y curva)."""
+        source = self.widget
+        widget = self.create_widget()
+        widget.current_width, widget.current_height = source.current_width, source.current_height
+        widget.update_size()
+        widget.set_metric(source.metric_key)
+        widget.set_speed_curve(source.speed_preset)
+        if source.target_gif_path:
+            widget.load_gif(source.target_gif_path)
+        
+        # Uno por monitor; si hay más widgets que monitores se escalonan
+        screens = QApplication.screens()
+        index = len(self.widgets) - 1
+        geometry = screens[index % len(screens)].availableGeometry()
+        offset = 100 + 40 * (index // len(screens))
+        widget.move(geometry.left() + offset, geometry.top() + offset)
+        widget.show()
+        self.set_active_widget(widget)
+        print(f"✓ Widget {widget.runner_id + 1} agregado ({len(self.widgets)} en total)")
+    
+    def close_active_widget(self):
+        """Cierra el widget activo (siempre queda al menos uno)."""
+        if len(self.widgets) < 2:
+            return
+        widget = self.widget
+        self.widgets.remove(widget)
+        widget.close()
+        widget.deleteLater()
+        self.set_active_widget(self.widgets[0])
+        self.sync_sampler_providers()
+    
+    def set_active_widget(self, widget):
+        """Elige el widget al que se aplican los menús (GIF, métrica, curva)."""
+        if widget not in self.widgets:
+            return
+        self.widget = widget
+        self.sync_menu_checks()
+    
+    def sync_sampler_providers(self):
+        """El sampler compartido lee solo las métricas que usa algún widget."""
+        keys = list(dict.fromkeys(widget.metric_key for widget in self.widgets))
+        if [provider.key for provider in self.sampler.providers] != keys:
+            self.sampler.set_providers([self.providers[key] for key in keys])
+    
+    def finish_startup(self):
+        """Fase 2 del arranque: catálogo y primer GIF (el widget ya está visible)."""
+        if self.startup_finished:
+            return
+        self.startup_finished = True
+        
+        if not self.catalog.loaded:
+            self.catalog.load()
+        self.report_assets()
+        
+        # --- Cargar primer GIF disponible ---
+        gifs = self.get_available_gifs()
+        if gifs:
+            self.widget.load_gif(gifs[0])
         
+        # El menú y la vigilancia van en otra vuelta del bucle para que el
+        # primer frame se pinte antes
+        QTimer.singleShot(0, self.finish_startup_menu)
+    
+    def finish_startup_menu(self):
+        """Fase 3 del arranque: vigilancia de assets, bandeja y precarga."""
         # --- Vigilar carpeta assets para cambios ---
         self.setup_file_watcher()
         
         # --- System Tray Icon ---
-        self.tray_icon = None
         self.create_tray_icon()
         
-        # --- Cargar primer GIF disponible ---
-        gifs = self.get_available_gifs()
-        if gifs:
-            self.widget.load_gif(gifs[0])
+        # --- Pre-decodificar el resto de GIFs mientras la app está ociosa ---
+        self.prefetch_queue = [path for path in self.get_available_gifs()
+                               if path != self.widget.target_gif_path]
+        QTimer.singleShot(0, self.prefetch_next_gif)
+    
+    def report_assets(self):
+        """Muestra en consola los GIFs encontrados en assets/."""
+        gifs = [Path(path) for path in self.catalog.paths()]
+        if not gifs:
+            print("⚠️  ADVERTENCIA: No se encontraron GIFs en 'assets/'")
+            print("   Coloca tus GIFs en la carpeta 'assets/'")
+            print("   Ejemplos: cat.gif, parrot.gif, horse.gif")
+            print()
+        else:
+            print(f"✓ Se encontraron {len(gifs)} GIF(s) en assets/:")
+            for gif in gifs:
+                print(f"  - {gif.name}")
+            print()
+    
+    def prefetch_next_gif(self):
+        """
+        Pide el siguiente GIF de la cola al hilo de precarga (sin bloquear).
         
-        self.widget.show()
+        Se decodifica y escala de a uno; los pixmaps se guardan en la caché
+        en el hilo de la interfaz al llegar (on_prefetch_ready).
+        """
+        size = (self.widget.current_width, self.widget.current_height)
+        while self.prefetch_queue:
+            gif_path = self.prefetch_queue.pop(0)
+            if (str(gif_path), *size) in self.frame_cache:
+                continue
+            info = self.catalog.get(gif_path)
+            frame_count = info.frame_count if info else None
+            if not self.frame_cache.fits(gif_path, *size, frame_count):
+                # Sin espacio en el presupuesto: el resto se decodifica al elegirlo
+                self.prefetch_queue = []
+                return
+            self.prefetch_token = self.prefetch_loader.request(gif_path, *size, evict=False)
+            return
+    
+    def on_prefetch_ready(self, token, gif):
+        """Un GIF precargado ya está en la caché: se pide el siguiente."""
+        if token != self.prefetch_token:
+            return
+        self.prefetch_token = None
+        QTimer.singleShot(0, self.prefetch_next_gif)
     
     def setup_file_watcher(self):
         """Configura el vigilante de archivos para detectar nuevos GIFs."""
-        assets_path = Path("assets")
+        assets_path = self.catalog.assets_dir
         if not assets_path.exists():
             assets_path.mkdir(parents=True, exist_ok=True)
         
+        # Una ráfaga de eventos (p. ej. copiar 50 GIFs) se agrupa en una
+        # sola actualización: cada evento reinicia la espera de 500 ms.
+        self.assets_refresh_timer = QTimer()
+        self.assets_refresh_timer.setSingleShot(True)
+        self.assets_refresh_timer.setInterval(500)
+        self.assets_refresh_timer.timeout.connect(self.refresh_assets)
+        # Qué llegó durante la espera: un cambio en la carpeta obliga a
+        # listarla entera; si solo cambiaron GIFs vigilados, basta con esos
+        self.assets_dir_changed = False
+        self.changed_asset_files = set()
+        
         self.file_watcher = QFileSystemWatcher()
         self.file_watcher.addPath(str(assets_path.resolve()))
         self.file_watcher.directoryChanged.connect(self.on_assets_changed)
+        # Archivos individuales: detecta GIFs sobrescritos con el mismo nombre
+        self.file_watcher.fileChanged.connect(self.on_asset_file_changed)
+        self.watch_catalog_files()
+    
+    def watch_catalog_files(self):
+        """Sincroniza la lista de archivos vigilados con el catálogo."""
+        watched = set(self.file_watcher.files())
+        current = set(self.catalog.paths())
+        stale = watched - current
+        new = current - watched
+        if stale:
+            self.file_watcher.removePaths(list(stale))
+        if new:
+            self.file_watcher.addPaths(list(new))
     
     def on_assets_changed(self, path):
         """Se ejecuta cuando cambia el contenido de la carpeta assets."""
-        print(f"🔄 Detectado cambio en carpeta assets")
+        if not self.assets_refresh_timer.isActive():
+            print(f"🔄 Detectado cambio en carpeta assets")
+        self.assets_dir_changed = True
         # Esperar un poco para que el archivo termine de copiarse
-        QTimer.singleShot(500, self.refresh_gif_menu)
+        self.assets_refresh_timer.start()
+    
+    def on_asset_file_changed(self, path):
+        """Un GIF ya catalogado fue modificado o eliminado."""
+        self.changed_asset_files.add(path)
+        self.assets_refresh_timer.start()
+    
+    def sync_changed_assets(self):
+        """
+        Actualiza el catálogo con lo acumulado desde el último refresco.
+        
+        Returns:
+            (agregados, modificados, eliminados) como listas de rutas
+        """
+        paths = self.changed_asset_files
+        self.changed_asset_files = set()
+        if self.assets_dir_changed:
+            self.assets_dir_changed = False
+            return self.catalog.sync()
+        
+        results = {"added": [], "changed": [], "removed": []}
+        for path in sorted(paths):
+            result = self.catalog.update_file(path)
+            if result is not None:
+                results[result].append(path)
+        return results["added"], results["changed"], results["removed"]
+    
+    def refresh_assets(self):
+        """Actualiza el catálogo (solo abre archivos nuevos o modificados) y el menú."""
+        added, changed, removed = self.sync_changed_assets()
+        for path in changed + removed:
+            self.frame_cache.discard(path)
+        for widget in self.widgets:
+            if widget.target_gif_path in changed:
+                widget.load_gif(widget.target_gif_path)
+        for path in changed:
+            if path in self.gif_actions:
+                self.request_thumbnail(path)
+        self.catalog.save()
+        self.watch_catalog_files()
+        if added or changed or removed:
+            print(f"   Catálogo: +{len(added)} ~{len(changed)} -{len(removed)}")
+        self.refresh_gif_menu()
     
     def create_icon(self):
         """Crea un icono simple para el tray."""
@@ -377,38 +1057,66 @@ class RAMRunnerApp:
         icon = self.create_icon()
         self.tray_icon.setIcon(icon)
         self.tray_icon.setToolTip("RAM Runner - Clic derecho para opciones")
+        self.clock.register("tooltip", 1000, self.update_tray_tooltip)
         
         # Crear menú principal
         menu = QMenu()
         
         # --- RUNNER (Submenú para seleccionar GIF) ---
-        runner_menu = menu.addMenu("Runner")
-        self.gif_action_group = QActionGroup(runner_menu)
+        self.runner_menu = menu.addMenu("Runner")
+        self.gif_action_group = QActionGroup(self.runner_menu)
         self.gif_action_group.setExclusive(True)
         
-        gifs = self.get_available_gifs()
-        if gifs:
-            for gif_path in gifs:
-                gif_name = Path(gif_path).stem.capitalize()
-                action = QAction(gif_name, runner_menu)
-                action.setCheckable(True)
-                action.setData(gif_path)
-                action.triggered.connect(lambda checked, path=gif_path: self.change_gif(path))
-                self.gif_action_group.addAction(action)
-                runner_menu.addAction(action)
-            
-            # Marcar el primero como seleccionado
-            self.gif_action_group.actions()[0].setChecked(True)
-        else:
-            no_gif_action = QAction("(Sin GIFs disponibles)", runner_menu)
-            no_gif_action.setEnabled(False)
-            runner_menu.addAction(no_gif_action)
+        self.no_gif_action = QAction("(Sin GIFs disponibles)", self.runner_menu)
+        self.no_gif_action.setEnabled(False)
+        self.runner_menu.addAction(self.no_gif_action)
         
         # Separador y opción para abrir carpeta
-        runner_menu.addSeparator()
-        open_folder_action = QAction("📁 Abrir carpeta de GIFs", runner_menu)
+        self.runner_separator = self.runner_menu.addSeparator()
+        open_folder_action = QAction("📁 Abrir carpeta de GIFs", self.runner_menu)
         open_folder_action.triggered.connect(self.open_assets_folder)
-        runner_menu.addAction(open_folder_action)
+        self.runner_menu.addAction(open_folder_action)
+        
+        # Las acciones de cada GIF se insertan antes del separador
+        self.sync_gif_actions()
+        
+        # --- MÉTRICA (qué controla la velocidad del runner) ---
+        metric_menu = menu.addMenu("Métrica")
+        metric_group = QActionGroup(metric_menu)
+        metric_group.setExclusive(True)
+        self.metric_actions = {}
+        for key, provider in self.providers.items():
+            action = QAction(provider.title, metric_menu)
+            action.setCheckable(True)
+            action.setChecked(key == self.widget.metric_key)
+            action.triggered.connect(lambda checked, key=key: self.widget.set_metric(key))
+            metric_group.addAction(action)
+            metric_menu.addAction(action)
+            self.metric_actions[key] = action
+        
+        # --- CURVA (cómo acelera el runner según la RAM) ---
+        curve_menu = menu.addMenu("Curva")
+        curve_group = QActionGroup(curve_menu)
+        curve_group.setExclusive(True)
+        self.curve_actions = {}
+        for preset, factory in PRESETS.items():
+            action = QAction(factory().name, curve_menu)
+            action.setCheckable(True)
+            action.setChecked(preset == self.widget.speed_preset)
+            action.triggered.connect(lambda checked, name=preset: self.widget.set_speed_curve(name))
+            curve_group.addAction(action)
+            curve_menu.addAction(action)
+            self.curve_actions[preset] = action
+        
+        # --- WIDGETS (varios runners, p. ej. uno por monitor) ---
+        self.widgets_menu = menu.addMenu("Widgets")
+        self.widgets_menu.aboutToShow.connect(self.refresh_widgets_menu)
+        self.refresh_widgets_menu()
+        
+        # --- DIAGNOSTICS (latencias y frames tardíos) ---
+        self.diagnostics_menu = menu.addMenu("Diagnostics")
+        self.diagnostics_menu.aboutToShow.connect(self.refresh_diagnostics_menu)
+        self.refresh_diagnostics_menu()
         
         # --- STARTUP (Iniciar con Windows) ---
         self.autostart_action = QAction("Startup", menu)
@@ -444,33 +1152,107 @@ class RAMRunnerApp:
     def on_tray_icon_activated(self, reason):
         """Maneja los clics en el icono de la bandeja."""
         if reason == QSystemTrayIcon.Trigger:  # Clic izquierdo
-            # Mostrar/ocultar el widget
-            if self.widget.isVisible():
-                self.widget.hide()
+            # Mostrar/ocultar todos los widgets
+            # Con los widgets ocultos el reloj se suspende: cero activaciones
+            if any(widget.isVisible() for widget in self.widgets):
+                for widget in self.widgets:
+                    widget.hide()
+                self.clock.suspend()
             else:
-                self.widget.show()
-                self.widget.raise_()
+                self.clock.resume()
+                for widget in self.widgets:
+                    widget.restart_playback()
+                    widget.show()
+                    widget.raise_()
                 self.widget.activateWindow()
     
+    def update_tray_tooltip(self):
+        """Muestra en el tooltip las activaciones por segundo del reloj."""
+        wakeups = self.clock.wakeups_per_second()
+        self.tray_icon.setToolTip(
+            f"RAM Runner - Clic derecho para opciones\n"
+            f"Activaciones: {wakeups}/s"
+        )
+    
+    def refresh_diagnostics_menu(self):
+        """Rellena el submenú Diagnostics con el resumen actual (al abrirlo)."""
+        self.diagnostics_menu.clear()
+        for line in self.widget.diagnostics.summary_lines():
+            action = self.diagnostics_menu.addAction(line)
+            action.setEnabled(False)
+        self.diagnostics_menu.addSeparator()
+        self.diagnostics_menu.addAction("💾 Exportar JSON", self.export_diagnostics)
+        self.diagnostics_menu.addAction("Reiniciar contadores", self.widget.diagnostics.reset)
+    
+    def export_diagnostics(self):
+        """Guarda el diagnóstico actual en .ram_runner_cache/ como JSON."""
+        clock = self.clock
+        extra = {
+            "widget": self.widget.runner_id + 1,
+            "widgets": len(self.widgets),
+            "gif": self.widget.current_gif_path,
+            "speed_percent": self.widget.speed_percent,
+            "clock": {
+                "wakeups_per_second": clock.wakeups_per_second(),
+                "total_wakeups": clock.total_wakeups,
+            },
+            "frame_cache": self.frame_cache.stats(),
+        }
+        path = CACHE_DIR / time.strftime("diagnostics-%Y%m%d-%H%M%S.json")
+        try:
+            path = self.widget.diagnostics.export(path, extra)
+        except OSError as e:
+            print(f"❌ Error al exportar diagnóstico: {e}")
+            return
+        print(f"✓ Diagnóstico exportado: {path.resolve()}")
+        if self.tray_icon:
+            self.tray_icon.showMessage("RAM Runner", f"Diagnóstico exportado:\n{path.resolve()}")
+    
+    def refresh_widgets_menu(self):
+        """Rellena el submenú Widgets: elegir el activo, agregar o cerrar."""
+        self.widgets_menu.clear()
+        group = QActionGroup(self.widgets_menu)
+        group.setExclusive(True)
+        for widget in self.widgets:
+            name = Path(widget.target_gif_path).stem.capitalize() if widget.target_gif_path else "-"
+            action = QAction(f"Widget {widget.runner_id + 1} ({name}, "
+                             f"{self.providers[widget.metric_key].label})", self.widgets_menu)
+            action.setCheckable(True)
+            action.setChecked(widget is self.widget)
+            action.triggered.connect(lambda checked, w=widget: self.set_active_widget(w))
+            group.addAction(action)
+            self.widgets_menu.addAction(action)
+        self.widgets_menu.addSeparator()
+        self.widgets_menu.addAction("➕ Agregar widget", self.add_widget)
+        close_action = self.widgets_menu.addAction("✖ Cerrar widget activo", self.close_active_widget)
+        close_action.setEnabled(len(self.widgets) > 1)
+    
+    def sync_menu_checks(self):
+        """Marca en los menús el GIF, la métrica y la curva del widget activo."""
+        if not self.tray_icon:
+            return
+        action = self.gif_actions.get(self.widget.target_gif_path)
+        if action:
+            action.setChecked(True)
+        action = self.metric_actions.get(self.widget.metric_key)
+        if action:
+            action.setChecked(True)
+        action = self.curve_actions.get(self.widget.speed_preset)
+        if action:
+            action.setChecked(True)
+    
     def get_available_gifs(self):
-        """Obtiene la lista de GIFs disponibles en la carpeta assets."""
-        assets_path = Path("assets")
-        if not assets_path.exists():
-            assets_path.mkdir(parents=True, exist_ok=True)
-            return []
-        
-        gifs = list(assets_path.glob("*.gif"))
-        return sorted([str(gif) for gif in gifs])
+        """Obtiene la lista de GIFs disponibles en la carpeta assets (desde el catálogo)."""
+        return self.catalog.paths()
     
     def change_gif(self, gif_path):
         """Cambia el GIF que se está mostrando."""
         self.widget.load_gif(gif_path)
         
         # Actualizar el check en el menú
-        for action in self.gif_action_group.actions():
-            if action.data() == gif_path:
-                action.setChecked(True)
-                break
+        action = self.gif_actions.get(gif_path)
+        if action:
+            action.setChecked(True)
     
     def open_assets_folder(self):
         """Abre la carpeta assets en el explorador de archivos."""
@@ -490,72 +1272,67 @@ class RAMRunnerApp:
         if not self.tray_icon or not self.tray_icon.contextMenu():
             return
         
-        menu = self.tray_icon.contextMenu()
-        
-        # Buscar el submenú Runner
-        for action in menu.actions():
-            if action.text() == "Runner" and action.menu():
-                runner_menu = action.menu()
-                
-                # Limpiar solo las acciones de GIFs (no la opción de abrir carpeta)
-                actions_to_remove = []
-                open_folder_action = None
-                
-                for sub_action in runner_menu.actions():
-                    if "Abrir carpeta" in sub_action.text():
-                        open_folder_action = sub_action
-                    elif not sub_action.isSeparator():
-                        actions_to_remove.append(sub_action)
-                
-                # Remover acciones antiguas
-                for sub_action in actions_to_remove:
-                    runner_menu.removeAction(sub_action)
-                
-                # Limpiar separadores
-                for sub_action in runner_menu.actions():
-                    if sub_action.isSeparator():
-                        runner_menu.removeAction(sub_action)
-                
-                # Remover temporalmente la acción de abrir carpeta
-                if open_folder_action:
-                    runner_menu.removeAction(open_folder_action)
-                
-                # Recrear lista de GIFs
-                self.gif_action_group = QActionGroup(runner_menu)
-                self.gif_action_group.setExclusive(True)
-                
-                gifs = self.get_available_gifs()
-                if gifs:
-                    for gif_path in gifs:
-                        gif_name = Path(gif_path).stem.capitalize()
-                        new_action = QAction(gif_name, runner_menu)
-                        new_action.setCheckable(True)
-                        new_action.setData(gif_path)
-                        new_action.triggered.connect(lambda checked, path=gif_path: self.change_gif(path))
-                        self.gif_action_group.addAction(new_action)
-                        runner_menu.addAction(new_action)
-                    
-                    # Marcar el GIF actualmente activo
-                    if self.widget.current_gif_path:
-                        for new_action in self.gif_action_group.actions():
-                            if new_action.data() == self.widget.current_gif_path:
-                                new_action.setChecked(True)
-                                break
-                    else:
-                        # Si no hay ninguno activo, marcar el primero
-                        self.gif_action_group.actions()[0].setChecked(True)
-                else:
-                    no_gif_action = QAction("(Sin GIFs disponibles)", runner_menu)
-                    no_gif_action.setEnabled(False)
-                    runner_menu.addAction(no_gif_action)
-                
-                # Agregar separador y opción de abrir carpeta
-                runner_menu.addSeparator()
-                if open_folder_action:
-                    runner_menu.addAction(open_folder_action)
-                
-                print(f"✓ Menú actualizado: {len(gifs)} GIF(s) encontrado(s)")
-                break
+        added, removed = self.sync_gif_actions()
+        if added or removed:
+            print(f"✓ Menú actualizado: {len(self.gif_actions)} GIF(s) encontrado(s)")
+    
+    def sync_gif_actions(self):
+        """
+        Actualiza el submenú Runner por diferencias con el catálogo.
+        
+        Solo se crean las acciones de GIFs nuevos y se quitan las de GIFs
+        eliminados; las demás (y la marca del GIF activo) no se tocan.
+        
+        Returns:
+            (agregados, eliminados) como listas de rutas
+        """
+        gifs = self.get_available_gifs()
+        current = set(gifs)
+        
+        removed = [path for path in self.gif_actions if path not in current]
+        for gif_path in removed:
+            action = self.gif_actions.pop(gif_path)
+            self.gif_action_group.removeAction(action)
+            self.runner_menu.removeAction(action)
+            action.deleteLater()
+        
+        # Insertar en orden: cada GIF nuevo va antes del siguiente ya existente
+        added = []
+        next_action = self.runner_separator
+        for gif_path in reversed(gifs):
+            action = self.gif_actions.get(gif_path)
+            if action is None:
+                action = QAction(Path(gif_path).stem.capitalize(), self.runner_menu)
+                action.setCheckable(True)
+                action.setData(gif_path)
+                action.triggered.connect(lambda checked, path=gif_path: self.change_gif(path))
+                self.gif_action_group.addAction(action)
+                self.runner_menu.insertAction(next_action, action)
+                self.gif_actions[gif_path] = action
+                self.request_thumbnail(gif_path)
+                added.append(gif_path)
+            next_action = action
+        
+        self.no_gif_action.setVisible(not gifs)
+        
+        # Marcar el GIF activo si todavía no hay ninguno marcado
+        if gifs and self.gif_action_group.checkedAction() is None:
+            active = self.gif_actions.get(self.widget.target_gif_path) or self.gif_actions[gifs[0]]
+            active.setChecked(True)
+        
+        return sorted(added), removed
+    
+    def request_thumbnail(self, gif_path):
+        """Pide la miniatura del primer frame (se genera en segundo plano)."""
+        info = self.catalog.get(gif_path)
+        if info:
+            self.thumbnails.request(gif_path, info.content_hash)
+    
+    def on_thumbnail_ready(self, gif_path, icon):
+        """Coloca la miniatura en la acción del menú, si el GIF sigue ahí."""
+        action = self.gif_actions.get(gif_path)
+        if action:
+            action.setIcon(icon)
     
     def toggle_autostart(self, checked):
         """Activa o desactiva el inicio automático con Windows."""
@@ -566,6 +1343,8 @@ class RAMRunnerApp:
     
     def is_autostart_enabled(self):
         """Verifica si el inicio automático está habilitado."""
+        if winreg is None:
+            return False
         try:
             key = winreg.OpenKey(
                 winreg.HKEY_CURRENT_USER,
@@ -577,14 +1356,17 @@ class RAMRunnerApp:
                 winreg.QueryValueEx(key, "RAMRunner")
                 winreg.CloseKey(key)
                 return True
-            except WindowsError:
+            except OSError:
                 winreg.CloseKey(key)
                 return False
-        except WindowsError:
+        except OSError:
             return False
     
     def enable_autostart(self):
         """Habilita el inicio automático con Windows."""
+        if winreg is None:
+            print("⚠️  El inicio automático solo está disponible en Windows")
+            return
         try:
             key = winreg.OpenKey(
                 winreg.HKEY_CURRENT_USER,
@@ -609,6 +1391,8 @@ class RAMRunnerApp:
     
     def disable_autostart(self):
         """Deshabilita el inicio automático con Windows."""
+        if winreg is None:
+            return
         try:
             key = winreg.OpenKey(
                 winreg.HKEY_CURRENT_USER,
@@ -619,7 +1403,7 @@ class RAMRunnerApp:
             try:
                 winreg.DeleteValue(key, "RAMRunner")
                 print("✓ Inicio automático deshabilitado")
-            except WindowsError:
+            except OSError:
                 pass
             winreg.CloseKey(key)
         except Exception as e:
@@ -628,9 +1412,14 @@ class RAMRunnerApp:
     def exit_app(self):
         """Cierra la aplicación completamente."""
         print("👋 Cerrando RAM Runner...")
+        print(f"   Activaciones del reloj (último segundo): {self.clock.wakeups_per_second()}/s")
+        self.thumbnails.shutdown()
+        self.prefetch_loader.shutdown()
         if self.tray_icon:
             self.tray_icon.hide()
-        self.widget.close()
+        for widget in self.widgets:
+            widget.close()
+        self.sampler.stop()
         self.app.quit()
     
     def run(self):
@@ -645,21 +1434,10 @@ def main():
         print("⚠️  Creando carpeta 'assets'...")
         assets_path.mkdir(parents=True, exist_ok=True)
     
-    gifs = list(assets_path.glob("*.gif"))
-    if not gifs:
-        print("⚠️  ADVERTENCIA: No se encontraron GIFs en 'assets/'")
-        print("   Coloca tus GIFs en la carpeta 'assets/'")
-        print("   Ejemplos: cat.gif, parrot.gif, horse.gif")
-        print()
-    else:
-        print(f"✓ Se encontraron {len(gifs)} GIF(s) en assets/:")
-        for gif in gifs:
-            print(f"  - {gif.name}")
-        print()
-    
-    app = RAMRunnerApp()
+    # El catálogo (y la lista de GIFs) se carga después de mostrar el widget
+    app = RAMRunnerApp(AssetCatalog(assets_path))
     sys.exit(app.run())
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,129 @@
+"""
+RAM Runner sin interfaz gráfica.
+
+Usa el mismo muestreo (ram_sampler) y la misma curva de velocidad
+(speed_curve) que el widget, pero no importa PyQt5: pensado para servidores.
+Cada lectura se imprime en una línea compacta:
+
+    2026-10-18T12:00:00 ram=42.1% speed=x1.29
+
+Uso:
+    python ram_runner_headless.py [--metric ram] [--curve cuadratica]
+                                  [--interval 1.0] [--count N] [--log archivo]
+    python ram_runner_headless.py --gui    # abre el widget (importa Qt)
+"""
+import argparse
+import sys
+import time
+
+from metric_providers import DEFAULT_PROVIDER, PROVIDER_CLASSES, create_provider
+from ram_sampler import MetricSampler
+from speed_curve import DEFAULT_PRESET, PRESETS, SpeedController
+
+
+class HeadlessRunner:
+    """
+    Muestreo + curva de velocidad sin Qt.
+
+    Args:
+        metric: Clave del proveedor (ver metric_providers.PROVIDER_CLASSES)
+        curve: Preset de speed_curve.PRESETS
+        min_interval: Intervalo mínimo del sampler (segundos)
+        max_interval: Intervalo máximo del sampler (segundos)
+    """
+
+    def __init__(self, metric=DEFAULT_PROVIDER, curve=DEFAULT_PRESET,
+                 min_interval=0.1, max_interval=1.0):
+        self.provider = create_provider(metric)
+        self.sampler = MetricSampler([self.provider], min_interval=min_interval,
+                                     max_interval=max_interval)
+        self.speed = SpeedController(PRESETS[curve]())
+
+    @property
+    def speed_factor(self):
+        """Factor de velocidad actual de la animación (1.0 = velocidad original)."""
+        return self.speed.speed_percent / 100.0
+
+    def start(self):
+        self.sampler.start()
+
+    def stop(self):
+        self.sampler.stop()
+
+    def poll(self):
+        """Procesa la última muestra. Retorna el valor o None si aún no hay."""
+        value = self.sampler.latest_value(self.provider.key)
+        if value is not None:
+            self.speed.update(value)
+        return value
+
+    def format_line(self, value):
+        timestamp = time.strftime("%Y-%m-%dT%H:%M:%S")
+        return f"{timestamp} {self.provider.key}={value:.1f}% speed=x{self.speed_factor:.2f}"
+
+    def run(self, interval=1.0, count=None, out=sys.stdout):
+        """Imprime una línea cada `interval` segundos (`count` líneas o sin fin)."""
+        self.start()
+        printed = 0
+        try:
+            # La primera muestra llega casi de inmediato
+            deadline = time.monotonic() + 1.0
+            while self.sampler.latest(self.provider.key) is None and time.monotonic() < deadline:
+                time.sleep(0.01)
+            while count is None or printed < count:
+                value = self.poll()
+                if value is not None:
+                    out.write(self.format_line(value) + "\n")
+                    out.flush()
+                    printed += 1
+                if count is None or printed < count:
+                    time.sleep(interval)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="RAM Runner sin interfaz gráfica")
+    parser.add_argument("--metric", default=DEFAULT_PROVIDER,
+                        choices=[cls.key for cls in PROVIDER_CLASSES],
+                        help="Métrica que controla la velocidad (por defecto: ram)")
+    parser.add_argument("--curve", default=DEFAULT_PRESET, choices=list(PRESETS),
+                        help="Curva de velocidad (por defecto: cuadratica)")
+    parser.add_argument("--interval", type=float, default=1.0,
+                        help="Segundos entre líneas (por defecto: 1.0)")
+    parser.add_argument("--count", type=int, default=None,
+                        help="Número de líneas a imprimir (por defecto: sin fin)")
+    parser.add_argument("--log", default=None,
+                        help="Agregar las líneas a este archivo en vez de la salida estándar")
+    parser.add_argument("--gui", action="store_true",
+                        help="Abrir el widget gráfico (importa PyQt5)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.gui:
+        # Import diferido: Qt solo se carga cuando realmente se pide el widget
+        import ram_runner
+        ram_runner.main()
+        return 0
+
+    try:
+        runner = HeadlessRunner(args.metric, args.curve)
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+
+    if args.log:
+        with open(args.log, "a", encoding="utf-8") as out:
+            runner.run(args.interval, args.count, out)
+    else:
+        runner.run(args.interval, args.count)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
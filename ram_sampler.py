@@ -0,0 +1,151 @@
+"""
+Muestreo de métricas en segundo plano para RAM Runner.
+
+El hilo de la interfaz (Qt) nunca debe bloquearse leyendo /proc o esperando
+a psutil. Este módulo ejecuta la lectura en un hilo dedicado que escribe
+muestras con marca de tiempo en un buffer circular preasignado; el widget
+solo consulta la última muestra.
+"""
+import threading
+import time
+from array import array
+
+from metric_providers import DEFAULT_PROVIDER, HostRamProvider, read_batch
+
+
+class SampleRingBuffer:
+    """Buffer circular de tamaño fijo con muestras (timestamp, valor).
+
+    La memoria se reserva una sola vez en el constructor; escribir una
+    muestra no crea objetos nuevos en el buffer.
+    """
+
+    def __init__(self, capacity=512):
+        if capacity < 1:
+            raise ValueError("capacity debe ser >= 1")
+        self.capacity = capacity
+        self._timestamps = array('d', bytes(8 * capacity))
+        self._values = array('d', bytes(8 * capacity))
+        self._count = 0  # Total de muestras escritas (no se reinicia)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return min(self._count, self.capacity)
+
+    def append(self, timestamp, value):
+        """Escribe una muestra sobrescribiendo la más antigua si está lleno."""
+        with self._lock:
+            idx = self._count % self.capacity
+            self._timestamps[idx] = timestamp
+            self._values[idx] = value
+            self._count += 1
+
+    def latest(self):
+        """Retorna la última muestra (timestamp, valor) o None si está vacío."""
+        with self._lock:
+            if self._count == 0:
+                return None
+            idx = (self._count - 1) % self.capacity
+            return self._timestamps[idx], self._values[idx]
+
+
+class MetricSampler(threading.Thread):
+    """Hilo que muestrea uno o varios proveedores con frecuencia adaptativa.
+
+    Todos los proveedores activos se leen en una misma pasada
+    (metric_providers.read_batch) y cada uno tiene su propio buffer circular.
+    Cuando algún valor cambia más que `change_threshold` entre dos lecturas
+    el intervalo vuelve a `min_interval`; mientras todo se mantiene estable
+    el intervalo crece gradualmente (factor `backoff`) hasta `max_interval`.
+
+    Args:
+        providers: Proveedores a leer (por defecto, RAM del sistema)
+        capacity: Número de muestras que guarda cada buffer circular
+        min_interval: Intervalo mínimo entre lecturas (segundos)
+        max_interval: Intervalo máximo entre lecturas (segundos)
+        change_threshold: Cambio (en puntos) que se considera "movimiento"
+        backoff: Factor con el que crece el intervalo cuando no hay cambios
+    """
+
+    def __init__(self, providers=None, capacity=512,
+                 min_interval=0.1, max_interval=1.0,
+                 change_threshold=0.2, backoff=1.5):
+        super().__init__(name="MetricSampler", daemon=True)
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("Se requiere 0 < min_interval <= max_interval")
+        self.capacity = capacity
+        self.buffers = {}  # clave del proveedor -> SampleRingBuffer
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.change_threshold = change_threshold
+        self.backoff = backoff
+        self.interval = min_interval
+        self.errors = 0
+        self._providers = ()
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
+        self.set_providers(providers if providers is not None else [HostRamProvider()])
+
+    @property
+    def providers(self):
+        return self._providers
+
+    def set_providers(self, providers):
+        """Cambia los proveedores activos; la siguiente lectura ocurre de inmediato."""
+        for provider in providers:
+            if provider.key not in self.buffers:
+                self.buffers[provider.key] = SampleRingBuffer(self.capacity)
+        # Reemplazo atómico de la tupla: el hilo nunca ve una lista a medias
+        self._providers = tuple(providers)
+        self.interval = self.min_interval
+        self._wake_event.set()
+
+    def latest(self, key=DEFAULT_PROVIDER):
+        """Última muestra (timestamp, valor) sin bloquear en E/S."""
+        buffer = self.buffers.get(key)
+        return buffer.latest() if buffer is not None else None
+
+    def latest_value(self, key=DEFAULT_PROVIDER, default=None):
+        """Último valor muestreado, o `default` si aún no hay muestras."""
+        sample = self.latest(key)
+        return default if sample is None else sample[1]
+
+    def sample_once(self):
+        """Lee todos los proveedores y ajusta el intervalo. Retorna {clave: valor}."""
+        results = read_batch(self._providers)
+        now = time.monotonic()
+
+        moving = False
+        for key, value in results:
+            buffer = self.buffers[key]
+            previous = buffer.latest()
+            if previous is None or abs(value - previous[1]) >= self.change_threshold:
+                moving = True
+            buffer.append(now, value)
+
+        if moving:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.max_interval, self.interval * self.backoff)
+        return dict(results)
+
+    def run(self):
+        while not self._stop_event.is_set():
+            self._wake_event.clear()
+            try:
+                self.sample_once()
+            except Exception as e:
+                # Una lectura fallida no debe matar el hilo; se reintenta
+                # en el siguiente ciclo con el intervalo más lento.
+                self.errors += 1
+                self.interval = self.max_interval
+                if self.errors == 1:
+                    print(f"⚠️  Error al muestrear métrica: {e}")
+            self._wake_event.wait(self.interval)
+
+    def stop(self, timeout=1.0):
+        """Detiene el hilo y espera a que termine."""
+        self._stop_event.set()
+        self._wake_event.set()
+        if self.is_alive():
+            self.join(timeout)
@@ -0,0 +1,178 @@
+"""
+Curvas de velocidad para la animación de RAM Runner.
+
+Una curva transforma el uso normalizado (0.0 - 1.0) en cuánto se acerca la
+animación a su velocidad máxima (0.0 - 1.0). Cada curva se precalcula una vez
+en una tabla (LUT) con resolución de 0.1 %, así evaluar la velocidad en cada
+tick es solo un acceso a la tabla.
+
+Este módulo no depende de Qt: lo usan tanto el widget como el modo headless.
+"""
+from array import array
+
+LUT_SIZE = 1001  # 0.0 %, 0.1 %, ..., 100.0 %
+
+
+def _clamp01(value):
+    return 0.0 if value < 0.0 else 1.0 if value > 1.0 else value
+
+
+class SpeedCurve:
+    """
+    Curva precalculada en una tabla de `LUT_SIZE` entradas.
+
+    Args:
+        name: Nombre para mostrar
+        fn: Función x -> y con x, y en [0, 1]
+    """
+
+    def __init__(self, name, fn):
+        self.name = name
+        last = LUT_SIZE - 1
+        self.lut = array('d', (_clamp01(fn(i / last)) for i in range(LUT_SIZE)))
+
+    def __call__(self, normalized):
+        """Valor de la curva para un uso normalizado (0.0 - 1.0)."""
+        index = int(normalized * (LUT_SIZE - 1) + 0.5)
+        if index < 0:
+            index = 0
+        elif index >= LUT_SIZE:
+            index = LUT_SIZE - 1
+        return self.lut[index]
+
+    @classmethod
+    def linear(cls):
+        """Aceleración uniforme en todo el rango."""
+        return cls("Lineal", lambda x: x)
+
+    @classmethod
+    def power(cls, exponent, name=None):
+        """x ** exponent: cuanto mayor el exponente, más se concentra al final."""
+        if exponent <= 0:
+            raise ValueError("exponent debe ser > 0")
+        return cls(name or f"Potencia {exponent:g}", lambda x: x ** exponent)
+
+    @classmethod
+    def threshold(cls, knee=0.8, low_gain=0.5, name=None):
+        """
+        Casi plana hasta `knee` y cuadrática a partir de ahí.
+
+        Por debajo del umbral sube con pendiente `low_gain`; por encima recorre
+        el resto hasta 1.0 con una curva cuadrática (sin saltos en el umbral).
+        """
+        if not 0 < knee < 1:
+            raise ValueError("knee debe estar entre 0 y 1")
+        base = knee * low_gain
+
+        def fn(x):
+            if x < knee:
+                return x * low_gain
+            return base + (1.0 - base) * ((x - knee) / (1.0 - knee)) ** 2
+
+        return cls(name or f"Umbral {knee:.0%}", fn)
+
+    @classmethod
+    def from_points(cls, points, name="Personalizada"):
+        """
+        Curva definida por puntos de control (x, y), interpolación lineal.
+
+        Ejemplo: SpeedCurve.from_points([(0, 0), (0.7, 0.2), (1, 1)])
+        """
+        points = sorted((float(x), float(y)) for x, y in points)
+        if len(points) < 2:
+            raise ValueError("Se necesitan al menos 2 puntos de control")
+        if any(not (0 <= x <= 1 and 0 <= y <= 1) for x, y in points):
+            raise ValueError("Los puntos de control deben estar en [0, 1]")
+
+        def fn(x):
+            if x <= points[0][0]:
+                return points[0][1]
+            for (x0, y0), (x1, y1) in zip(points, points[1:]):
+                if x <= x1:
+                    if x1 == x0:
+                        return y1
+                    return y0 + (y1 - y0) * (x - x0) / (x1 - x0)
+            return points[-1][1]
+
+        return cls(name, fn)
+
+
+# Curvas disponibles desde el menú (clave -> fábrica)
+PRESETS = {
+    "lineal": SpeedCurve.linear,
+    "moderada": lambda: SpeedCurve.power(1.5, "Moderada (x^1.5)"),
+    "cuadratica": lambda: SpeedCurve.power(2, "Cuadrática (x^2)"),
+    "cubica": lambda: SpeedCurve.power(3, "Cúbica (x^3)"),
+    "umbral": lambda: SpeedCurve.threshold(0.8, 0.5, "Umbral 80%"),
+}
+DEFAULT_PRESET = "cuadratica"
+
+
+class SpeedController:
+    """
+    Convierte el porcentaje de uso en velocidad de animación.
+
+    El valor de entrada se suaviza con una media móvil exponencial (EMA) y la
+    velocidad efectiva solo cambia cuando la nueva difiere de la actual en más
+    de `hysteresis` (relativo), así pequeñas oscilaciones de 0.1 % no alteran
+    el ritmo de la animación.
+
+    Args:
+        curve: SpeedCurve a usar (por defecto la cuadrática)
+        max_interval_ms: Intervalo de animación con uso 0 %
+        min_interval_ms: Intervalo de animación con uso 100 %
+        smoothing: Factor de la EMA (1.0 = sin suavizado)
+        hysteresis: Cambio relativo mínimo para aplicar una nueva velocidad
+    """
+
+    def __init__(self, curve=None, max_interval_ms=300, min_interval_ms=30,
+                 smoothing=0.3, hysteresis=0.03):
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing debe estar en (0, 1]")
+        self.max_interval_ms = max_interval_ms
+        self.min_interval_ms = min_interval_ms
+        self.smoothing = smoothing
+        self.hysteresis = hysteresis
+        self.smoothed_percent = None
+        self.speed_percent = 100  # Velocidad efectiva (100 = velocidad original)
+        self.set_curve(curve or PRESETS[DEFAULT_PRESET]())
+
+    def set_curve(self, curve):
+        """Cambia la curva y precalcula la tabla de velocidades."""
+        self.curve = curve
+        span = self.max_interval_ms - self.min_interval_ms
+        self._speed_lut = array('i', (
+            int(self.max_interval_ms / (span * (1.0 - y) + self.min_interval_ms) * 100)
+            for y in curve.lut
+        ))
+
+    def interval_ms(self, percent):
+        """Intervalo de animación (ms) para un porcentaje de uso."""
+        curved = self.curve(percent / 100.0)
+        return (self.max_interval_ms - self.min_interval_ms) * (1.0 - curved) + self.min_interval_ms
+
+    def speed_for(self, percent):
+        """Velocidad (porcentaje, 100 = original) para un uso sin suavizar."""
+        index = int(percent * (LUT_SIZE - 1) / 100.0 + 0.5)
+        if index < 0:
+            index = 0
+        elif index >= LUT_SIZE:
+            index = LUT_SIZE - 1
+        return self._speed_lut[index]
+
+    def update(self, percent):
+        """
+        Procesa una nueva lectura.
+
+        Retorna True si la velocidad efectiva cambió (y debe aplicarse).
+        """
+        if self.smoothed_percent is None:
+            self.smoothed_percent = percent
+        else:
+            self.smoothed_percent += self.smoothing * (percent - self.smoothed_percent)
+
+        target = self.speed_for(self.smoothed_percent)
+        if abs(target - self.speed_percent) < self.speed_percent * self.hysteresis:
+            return False
+        self.speed_percent = target
+        return True
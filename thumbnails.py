@@ -0,0 +1,90 @@
+"""
+Miniaturas del primer frame de cada GIF para el menú Runner.
+
+Las miniaturas se generan en un pool de hilos y se guardan en disco con el
+hash del contenido del GIF como nombre, así solo se generan una vez por
+versión del archivo. El menú se rellena de forma asíncrona: abrirlo nunca
+espera por la decodificación de imágenes.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from PyQt5.QtCore import QObject, Qt, pyqtSignal
+from PyQt5.QtGui import QIcon, QImage, QImageReader, QPixmap
+
+from asset_catalog import CACHE_DIR
+
+
+class ThumbnailService(QObject):
+    """
+    Genera (o lee de la caché en disco) miniaturas de GIFs.
+
+    `ready(ruta_gif, QIcon)` se emite en el hilo de la interfaz cuando la
+    miniatura está lista.
+
+    Args:
+        cache_dir: Carpeta para los PNG de las miniaturas
+        size: Lado máximo de la miniatura en píxeles
+        max_workers: Hilos del pool de generación
+    """
+
+    ready = pyqtSignal(str, QIcon)
+    _image_ready = pyqtSignal(str, str, QImage)
+
+    def __init__(self, cache_dir=CACHE_DIR / "thumbs", size=32, max_workers=2, parent=None):
+        super().__init__(parent)
+        self.cache_dir = Path(cache_dir)
+        self.size = size
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix="Thumbnails")
+        self._pending = set()
+        self._image_ready.connect(self._on_image_ready)
+
+    def thumbnail_path(self, content_hash):
+        return self.cache_dir / f"{content_hash}_{self.size}.png"
+
+    def request(self, gif_path, content_hash):
+        """Encola la miniatura de un GIF; no bloquea."""
+        key = (str(gif_path), content_hash)
+        if key in self._pending:
+            return
+        self._pending.add(key)
+        self._executor.submit(self._work, str(gif_path), content_hash)
+
+    def _work(self, gif_path, content_hash):
+        try:
+            image = self._load_or_generate(gif_path, content_hash)
+        except Exception as e:
+            print(f"⚠️  Error al generar miniatura de {gif_path}: {e}")
+            image = QImage()
+        try:
+            self._image_ready.emit(gif_path, content_hash, image)
+        except RuntimeError:
+            pass  # El servicio ya fue destruido (app cerrándose)
+
+    def _load_or_generate(self, gif_path, content_hash):
+        thumb_path = self.thumbnail_path(content_hash)
+        if thumb_path.exists():
+            image = QImage(str(thumb_path))
+            if not image.isNull():
+                return image
+
+        image = QImageReader(gif_path).read()
+        if image.isNull():
+            return image
+        image = image.scaled(self.size, self.size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = thumb_path.with_suffix(".tmp.png")
+        if image.save(str(tmp_path), "PNG"):
+            tmp_path.replace(thumb_path)
+        return image
+
+    def _on_image_ready(self, gif_path, content_hash, image):
+        self._pending.discard((gif_path, content_hash))
+        if not image.isNull():
+            self.ready.emit(gif_path, QIcon(QPixmap.fromImage(image)))
+
+    def shutdown(self):
+        """Descarta las miniaturas pendientes."""
+        self._executor.shutdown(wait=False, cancel_futures=True)